@@ -1,18 +1,25 @@
 #!/usr/bin/env python3
 import sys
 import os
+import io
+import codecs
+import re
 import threading
 import subprocess
+import queue
+import asyncio
 import time
+import functools
+import gc
+import itertools
+import pickle
+import importlib.util
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
-try:
-    # Ensure local package import works when run from this file
-    sys.path.insert(0, os.path.dirname(__file__))
-    from tradedangerous import commands as td_commands
-except Exception as e:
-    raise SystemExit(f"Failed to import tradedangerous: {e}")
+# Ensure local package import works when run from this file; tradedangerous
+# itself is imported lazily (see load_commands)
+sys.path.insert(0, os.path.dirname(__file__))
 
 # --- GUI toolkit ---
 import tkinter as tk
@@ -22,72 +29,96 @@ from tkinter.scrolledtext import ScrolledText
 from tkinter import filedialog, messagebox
 
 
+# ANSI escape sequences in command output (colors and any other CSI/Fe codes);
+# none can span a newline, so stripping per line or per text is equivalent
+_ANSI_RE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+# First line of a route block in 'run' output: "<origin> -> <dest> [(score: ...)]"
+_ROUTE_START_RE = re.compile(r"^\s*(.+?)\s*->\s*(.+?)(?:\s*\(score:.*)?\s*$")
+# Same pattern for scanning whole text; whitespace may not cross line breaks
+_ROUTE_START_ML_RE = re.compile(
+    r"^[^\S\n]*(.+?)[^\S\n]*->[^\S\n]*(.+?)(?:[^\S\n]*\(score:.*)?[^\S\n]*$", re.MULTILINE
+)
+# Characters that make a preview argument need quoting
+_SHELL_SPECIAL_RE = re.compile(r"[\s/]")
+
+
+def _strip_ansi_text(s: str) -> str:
+    # Most text has no escapes at all; a substring check skips the regex engine
+    return _ANSI_RE.sub("", s) if "\x1b" in s else s
+
+
+@functools.lru_cache(maxsize=512)
+def _quote_double(s: str) -> str:
+    # For preview: trim leading/trailing whitespace
+    s = str(s).strip()
+    if s == "" or _SHELL_SPECIAL_RE.search(s):
+        return '"' + s.replace('"', '\\"') + '"'
+    return s
+
+
+@functools.lru_cache(maxsize=None)
+def _reportlab():
+    # Optional PDF dependency, imported on first PDF export and reused after.
+    # A failed import is not cached, so installing reportlab mid-session works.
+    try:
+        from reportlab.lib.pagesizes import letter
+        from reportlab.pdfgen import canvas
+        from reportlab.lib.units import inch
+        from reportlab.pdfbase.pdfmetrics import stringWidth
+    except Exception:
+        raise RuntimeError("PDF export requires 'reportlab'. Install with: pip install reportlab")
+    return letter, canvas, inch, stringWidth
+
+
 # ---------- Introspection models ----------
 
-@dataclass(eq=False)
+@dataclass(frozen=True, eq=False)
 class OptionSpec:
     args: Tuple[str, ...]
     kwargs: Dict[str, Any]
     group_id: Optional[int] = None
 
-    @property
-    def long_flag(self) -> str:
+    # Derived values, computed once in __post_init__ (read in tight loops)
+    long_flag: str = field(init=False, repr=False)
+    display_name: str = field(init=False, repr=False)
+    help: str = field(init=False, repr=False)
+    action: Optional[str] = field(init=False, repr=False)
+    is_flag: bool = field(init=False, repr=False)
+    is_positional: bool = field(init=False, repr=False)
+    key: str = field(init=False, repr=False)
+    metavar: Optional[str] = field(init=False, repr=False)
+    default: Any = field(init=False, repr=False)
+    choices: Optional[List[str]] = field(init=False, repr=False)
+    dest: Optional[str] = field(init=False, repr=False)
+    multiple: bool = field(init=False, repr=False)
+
+    def __post_init__(self):
+        kw = self.kwargs
         # Prefer a long option (starts with --), else the first
         longs = [a for a in self.args if a.startswith("--")]
-        return longs[0] if longs else self.args[0]
-
-    @property
-    def display_name(self) -> str:
-        return self.long_flag
-
-    @property
-    def help(self) -> str:
-        return self.kwargs.get("help", "")
-
-    @property
-    def action(self) -> Optional[str]:
-        return self.kwargs.get("action")
-
-    @property
-    def is_flag(self) -> bool:
-        return self.action == "store_true"
-
-    @property
-    def is_positional(self) -> bool:
+        long_flag = longs[0] if longs else (self.args[0] if self.args else "")
+        action = kw.get("action")
         # Positional args in our CLI have names without leading dashes
-        try:
-            first = self.args[0]
-        except Exception:
-            return False
-        return not (isinstance(first, str) and first.startswith("-"))
-
-    @property
-    def key(self) -> str:
+        first = self.args[0] if self.args else None
+        is_positional = first is not None and not (isinstance(first, str) and first.startswith("-"))
         # Stable identifier used for saving/restoring state
-        try:
-            return self.kwargs.get("dest") or (self.args[0] if self.args else self.long_flag.lstrip('-'))
-        except Exception:
-            return self.long_flag.lstrip('-')
-
-    @property
-    def metavar(self) -> Optional[str]:
-        return self.kwargs.get("metavar")
-
-    @property
-    def default(self) -> Any:
-        return self.kwargs.get("default")
-
-    @property
-    def choices(self) -> Optional[List[str]]:
-        return self.kwargs.get("choices")
-
-    @property
-    def dest(self) -> Optional[str]:
-        return self.kwargs.get("dest")
-
-    @property
-    def multiple(self) -> bool:
-        return self.action == "append"
+        key = kw.get("dest") or (self.args[0] if self.args else long_flag.lstrip('-'))
+        derived = {
+            "long_flag": long_flag,
+            "display_name": long_flag,
+            "help": kw.get("help", ""),
+            "action": action,
+            "is_flag": action == "store_true",
+            "is_positional": is_positional,
+            "key": key,
+            "metavar": kw.get("metavar"),
+            "default": kw.get("default"),
+            "choices": kw.get("choices"),
+            "dest": kw.get("dest"),
+            "multiple": action == "append",
+        }
+        for name, value in derived.items():
+            object.__setattr__(self, name, value)
 
 
 @dataclass
@@ -113,13 +144,66 @@ def _flatten_args(items: List[Any]) -> List[OptionSpec]:
     return flat
 
 
-def load_commands() -> Dict[str, CommandMeta]:
+# Bump when CommandMeta/OptionSpec change shape so stale caches are ignored
+_COMMANDS_CACHE_VERSION = 1
+
+
+def _commands_cache_key() -> Optional[Tuple[Any, ...]]:
+    # Fingerprint of the command modules, located without importing tradedangerous
+    try:
+        spec = importlib.util.find_spec("tradedangerous")
+        if spec is None or not spec.submodule_search_locations:
+            return None
+        cmd_dir = os.path.join(list(spec.submodule_search_locations)[0], "commands")
+        stamps = []
+        for entry in sorted(os.scandir(cmd_dir), key=lambda e: e.name):
+            if entry.name.endswith(".py"):
+                st = entry.stat()
+                stamps.append((entry.name, st.st_mtime_ns, st.st_size))
+        return (_COMMANDS_CACHE_VERSION, cmd_dir, tuple(stamps))
+    except Exception:
+        return None
+
+
+def _introspect_commands() -> Dict[str, CommandMeta]:
+    try:
+        from tradedangerous import commands as td_commands
+    except Exception as e:
+        raise SystemExit(f"Failed to import tradedangerous: {e}")
     metas: Dict[str, CommandMeta] = {}
     for cmd_name, module in td_commands.commandIndex.items():
         help_text = getattr(module, "help", cmd_name)
         arguments = _flatten_args(getattr(module, "arguments", []))
         switches = _flatten_args(getattr(module, "switches", []))
         metas[cmd_name] = CommandMeta(cmd_name, help_text, arguments, switches)
+    return metas
+
+
+def load_commands(cache_path: Optional[str] = None) -> Dict[str, CommandMeta]:
+    # With a cache_path, reuse the pickled introspection result while the command
+    # modules are unchanged, so startup doesn't import the whole command tree
+    key = _commands_cache_key() if cache_path else None
+    metas: Optional[Dict[str, CommandMeta]] = None
+    if key is not None and os.path.isfile(cache_path):
+        try:
+            with open(cache_path, "rb") as f:
+                cached_key, cached = pickle.load(f)
+            if cached_key == key:
+                metas = cached
+        except Exception:
+            metas = None
+    if metas is None:
+        metas = _introspect_commands()
+        if key is not None:
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                tmp = cache_path + ".tmp"
+                with open(tmp, "wb") as f:
+                    pickle.dump((key, metas), f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, cache_path)
+            except Exception:
+                # e.g. argument kwargs holding unpicklable callables; just don't cache
+                pass
     # Add a convenience action for updating/rebuilding the DB via eddblink plugin
     metas["Update/Rebuild DB"] = CommandMeta(
         name="import",
@@ -131,8 +215,231 @@ def load_commands() -> Dict[str, CommandMeta]:
     return metas
 
 
+# ---------- Route parsing ----------
+
+def _route_record(block: str, dest: str) -> Dict[str, str]:
+    # Derived fields are computed once here rather than by every consumer
+    lines = block.splitlines()
+    return {
+        "block": block,
+        "dest": dest,
+        "title": lines[0] if lines else "",
+        # Short preview of the next lines, as shown in the route list and CSV
+        "preview": " | ".join(ln.strip() for ln in lines[1:6]),
+    }
+
+
+def parse_route_blocks(text: str) -> List[Dict[str, str]]:
+    """Split complete 'run' output into route blocks in one regex pass."""
+    text = _strip_ansi_text(text)
+    routes: List[Dict[str, str]] = []
+    matches = list(_ROUTE_START_ML_RE.finditer(text))
+    # Anything before the first route start is kept as its own block
+    head = text[:matches[0].start()] if matches else text
+    head = head.strip()
+    if head:
+        routes.append(_route_record(head, ""))
+    for i, m in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        routes.append(_route_record(text[m.start():end].strip(), m.group(2).strip()))
+    return routes
+
+
+class RouteStreamParser:
+    """Split 'run' output into route blocks incrementally as text arrives."""
+
+    def __init__(self):
+        # Trailing text of the last chunk that has no newline yet
+        self._partial = ""
+        # Lines of the block currently being accumulated
+        self._current: List[str] = []
+        # Destination parsed from the block's first line, if it is a route start
+        self._current_dest = ""
+
+    def feed(self, text: str) -> List[Dict[str, str]]:
+        """Consume a chunk of output and return the route blocks it completed."""
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        routes: List[Dict[str, str]] = []
+        for ln in lines:
+            self._feed_line(ln, routes)
+        return routes
+
+    def close(self) -> List[Dict[str, str]]:
+        """Flush buffered text at end of output and return the final block, if any."""
+        routes: List[Dict[str, str]] = []
+        if self._partial:
+            self._feed_line(self._partial, routes)
+            self._partial = ""
+        self._flush(routes)
+        return routes
+
+    # Helpers bound once, not looked up per line
+    _strip = staticmethod(_strip_ansi_text)
+    _start_match = staticmethod(_ROUTE_START_RE.match)
+
+    def _feed_line(self, ln: str, routes: List[Dict[str, str]]):
+        ln = self._strip(ln)
+        m = self._start_match(ln)
+        if m:
+            self._flush(routes)
+        if ln.strip() == "":
+            # keep blank lines to preserve block text, but don't accumulate leading empties
+            if self._current:
+                self._current.append(ln)
+            return
+        if not self._current:
+            # Reuse this match for the block's destination instead of re-matching on flush
+            self._current_dest = m.group(2).strip() if m else ""
+        self._current.append(ln)
+
+    def _flush(self, routes: List[Dict[str, str]]):
+        current = self._current
+        if not current:
+            return
+        self._current = []
+        block = "\n".join(current).strip()
+        if block:
+            routes.append(_route_record(block, self._current_dest))
+
+
 # ---------- GUI ----------
 
+# Queued by the run reader thread once the subprocess has exited
+_RUN_DONE = object()
+# Bindtag carried by every widget inside a mouse-wheel scrollable area
+_SCROLL_TAG = "Scrollable"
+# Default cap on lines kept in the Output tab (older lines are dropped)
+_DEFAULT_OUTPUT_MAX_LINES = 20000
+# Selector sections for 'run', by option dest (or long flag without dashes)
+_RUN_SECTIONS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("Required", ("capacity", "credits")),
+    ("Other", ("starting", "ending", "via", "limit", "blackMarket", "unique", "pruneScores", "shorten", "routes", "maxRoutes", "pruneHops")),
+    ("Travel", ("goalSystem", "loop", "direct", "hops", "maxJumpsPer", "maxLyPer", "emptyLyPer", "startJumps", "endJumps", "showJumps", "supply", "demand")),
+    ("Filters", ("avoid", "maxAge", "lsPenalty", "demand", "supply")),
+    ("Constraints", ("padSize", "noPlanet", "planetary", "fleet", "odyssey", "maxLs")),
+    ("Economy", ("minGainPerTon", "maxGainPerTon", "margin", "insurance")),
+    ("Display", ("checklist", "x52pro", "progress", "summary")),
+)
+_RUN_SECTION_TITLES: Tuple[str, ...] = tuple(t for t, _ in _RUN_SECTIONS)
+
+# Shared result for "no command selected" (immutable, so safe to share)
+_NO_GROUPS: Sequence[Tuple[str, List[OptionSpec]]] = ()
+
+
+def _run_name_positions() -> Dict[str, Tuple[int, int]]:
+    # name -> (section index, position in section); a name listed in two
+    # sections belongs to the first
+    pos: Dict[str, Tuple[int, int]] = {}
+    for i, (_, names) in enumerate(_RUN_SECTIONS):
+        for j, n in enumerate(names):
+            pos.setdefault(n, (i, j))
+    return pos
+
+
+_RUN_NAME_POS = _run_name_positions()
+
+# Bootstrap for a pre-started ("warm") worker interpreter: pay the Python and
+# tradedangerous import cost up front, then wait for one JSON argv line on stdin
+# and run trade.py with it exactly as `python trade.py <args>` would.
+_WARM_WORKER_SRC = """\
+import json, os, runpy, sys
+trade_py = sys.argv[1]
+sys.path.insert(0, os.path.dirname(trade_py))
+try:
+    import tradedangerous.cli, tradedangerous.commands
+except Exception:
+    pass
+line = sys.stdin.readline()
+if not line:
+    sys.exit(0)
+sys.argv = [trade_py] + json.loads(line)
+runpy.run_path(trade_py, run_name="__main__")
+"""
+
+
+def _tcl_quote(v: Any) -> str:
+    # Brace-quote a value for a Tcl script; sequences become Tcl lists
+    if isinstance(v, (tuple, list)):
+        return "{" + " ".join(_tcl_quote(x) for x in v) + "}"
+    return "{" + str(v) + "}"
+
+
+@functools.lru_cache(maxsize=4)
+def _theme_script(color_items: Tuple[Tuple[str, str], ...]) -> str:
+    """Build the ttk style / option database setup for a palette as one Tcl script."""
+    c = dict(color_items)
+    configure: List[Tuple[str, Dict[str, Any]]] = [
+        # Global style tweaks
+        (".", dict(foreground=c["fg"], background=c["bg"], fieldbackground=c["surface"],
+                   bordercolor=c["line"], lightcolor=c["bg"], darkcolor=c["bg"], focuscolor=c["primary"])),
+        # Containers / text
+        ("TFrame", dict(background=c["bg"])),
+        ("TLabelframe", dict(background=c["bg"], foreground=c["fg"], bordercolor=c["line"], relief="groove")),
+        ("TLabelframe.Label", dict(background=c["bg"], foreground=c["fg"])),
+        ("TLabel", dict(background=c["bg"], foreground=c["fg"])),
+        # Inputs
+        ("TEntry", dict(fieldbackground=c["surface"], foreground=c["fg"], bordercolor=c["line"], insertcolor=c["fg"])),
+        ("TCombobox", dict(fieldbackground=c["surface"], foreground=c["fg"], bordercolor=c["line"], arrowsize=12, insertcolor=c["fg"])),
+        ("TSpinbox", dict(fieldbackground=c["surface"], foreground=c["fg"], bordercolor=c["line"])),
+        # Buttons
+        ("TButton", dict(background=c["panel"], foreground=c["fg"], bordercolor=c["line"], focusthickness=2, focuscolor=c["primary"])),
+        ("Accent.TButton", dict(background=c["primary"], foreground=c["fg"], bordercolor=c["primary"], relief="flat")),
+        ("Secondary.TButton", dict(background=c["secondary"], foreground=c["fg"], bordercolor=c["secondary"], relief="flat")),
+        # Notebook
+        ("TNotebook", dict(background=c["bg"], borderwidth=0, tabmargins=(6, 4, 6, 0))),
+        ("TNotebook.Tab", dict(background=c["panel"], foreground=c["fg"], padding=(12, 6), bordercolor=c["line"])),
+        # Route list
+        ("Routes.Treeview", dict(background=c["panel"], fieldbackground=c["panel"], foreground=c["fg"], bordercolor=c["line"])),
+        ("Routes.Treeview.Heading", dict(background=c["surface"], foreground=c["fg"], bordercolor=c["line"])),
+        # Paned window / scrollbars
+        ("TPanedwindow", dict(background=c["bg"], sashrelief="flat")),
+        ("Vertical.TScrollbar", dict(background=c["panel"], troughcolor=c["bg"], arrowcolor=c["fg"])),
+        ("Horizontal.TScrollbar", dict(background=c["panel"], troughcolor=c["bg"], arrowcolor=c["fg"])),
+    ]
+    maps: List[Tuple[str, Dict[str, List[Tuple[str, str]]]]] = [
+        ("TEntry", dict(fieldbackground=[("focus", c["surface"])], bordercolor=[("focus", c["primary"])])),
+        ("TCombobox", dict(fieldbackground=[("readonly", c["surface"])], bordercolor=[("focus", c["primary"])],
+                           foreground=[("disabled", c["muted"])])),
+        ("TSpinbox", dict(bordercolor=[("focus", c["primary"])])),
+        ("TButton", dict(background=[("active", c["line"])], bordercolor=[("focus", c["primary"])])),
+        ("Accent.TButton", dict(background=[("active", c["primaryActive"])])),
+        ("Secondary.TButton", dict(background=[("active", c["secondaryActive"])])),
+        ("TNotebook.Tab", dict(background=[("selected", c["surface"]), ("active", c["panel"])],
+                               foreground=[("selected", c["fg"])])),
+        ("Routes.Treeview", dict(background=[("selected", c["line"])], foreground=[("selected", c["fg"])])),
+        ("Routes.Treeview.Heading", dict(background=[("active", c["line"])])),
+    ]
+    # Tk widgets option db (Text/Listbox/Scrollbar popups; Entry insertion
+    # cursor color for classic Tk widgets and some ttk themes)
+    options: List[Tuple[str, str]] = [
+        ("*Text.background", c["surface"]),
+        ("*Text.foreground", c["fg"]),
+        ("*Text.insertBackground", c["fg"]),
+        ("*Entry.insertBackground", c["fg"]),
+        ("*Text.selectBackground", c["line"]),
+        ("*Text.selectForeground", c["fg"]),
+        ("*Listbox.background", c["surface"]),
+        ("*Listbox.foreground", c["fg"]),
+        ("*Listbox.selectBackground", c["line"]),
+        ("*Listbox.selectForeground", c["fg"]),
+        ("*Scrollbar.background", c["panel"]),
+        ("*Scrollbar.activeBackground", c["panel"]),
+        ("*Scrollbar.troughColor", c["bg"]),
+        ("*Scrollbar.arrowColor", c["fg"]),
+    ]
+    lines: List[str] = []
+    for style, opts in configure:
+        lines.append("ttk::style configure " + _tcl_quote(style) + "".join(
+            f" -{k} {_tcl_quote(v)}" for k, v in opts.items()))
+    for style, specs in maps:
+        lines.append("ttk::style map " + _tcl_quote(style) + "".join(
+            f" -{k} {_tcl_quote([x for pair in spec for x in pair])}" for k, spec in specs.items()))
+    for pattern, value in options:
+        lines.append(f"option add {_tcl_quote(pattern)} {_tcl_quote(value)}")
+    return "\n".join(lines)
+
+
 class TdGuiApp(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -141,6 +448,57 @@ class TdGuiApp(tk.Tk):
         self.minsize(900, 560)
         # Suspend preference writes during first-time UI construction
         self._suspend_save = True
+        # Pending after() ids for coalesced preview rebuilds and preference writes
+        self._preview_job = None
+        self._save_job = None
+        # Preferences location, resolved (and created) once
+        self._cfg_dir = self._compute_config_dir()
+        self._prefs_file = os.path.join(self._cfg_dir, 'td_gui_prefs.json')
+        try:
+            os.makedirs(self._cfg_dir, exist_ok=True)
+        except Exception:
+            pass
+        # Last preferences JSON written to disk (writes are skipped if unchanged);
+        # owned by the writer thread
+        self._last_saved_blob: Optional[str] = None
+        # Prefs are serialized and written on a background thread; only the
+        # newest pending snapshot is written (guarded by the lock)
+        self._prefs_lock = threading.Lock()
+        self._pending_prefs: Optional[Tuple[str, Dict[str, Any]]] = None
+        self._prefs_writer: Optional[threading.Thread] = None
+        # Pending after_idle ids and last applied scrollregion, per canvas
+        self._scrollregion_jobs: Dict[str, str] = {}
+        self._scrollregion_last: Dict[str, Any] = {}
+        # Cached command-line parts; rebuilt only after an option/global change
+        self._args_dirty = True
+        self._cached_args: List[str] = []
+        # Run output produced by the reader thread, drained on a Tk timer
+        self._out_q: "queue.Queue[Any]" = queue.Queue()
+        # Event loop on a helper thread that drives command subprocesses
+        self._aio_loop = asyncio.new_event_loop()
+        threading.Thread(target=self._aio_loop.run_forever, daemon=True).start()
+        # Pre-started worker for the next run (only touched on the asyncio loop)
+        self._warm_proc: Optional[asyncio.subprocess.Process] = None
+        self._warm_spawning = False
+        # Process of the run in progress, and set once the window is closing
+        # (both only touched on the asyncio loop)
+        self._run_proc: Optional[asyncio.subprocess.Process] = None
+        self._aio_closing = False
+        # Parses 'run' output into the route list while it streams in
+        self._route_parser: Optional[RouteStreamParser] = None
+        # Last full-text parse, keyed on a (len, hash) fingerprint of the text,
+        # and the fingerprint of the text the route list currently shows
+        self._routes_cache: Optional[Tuple[Tuple[int, int], List[Dict[str, str]]]] = None
+        self._routes_shown_fp: Optional[Tuple[int, int]] = None
+        # Streamed routes waiting for the next route list refresh
+        self._pending_routes: List[Dict[str, str]] = []
+        self._routes_refresh_job = None
+        # Output tab line cap (0 disables); overridable via 'output_max_lines' pref
+        self._output_max_lines = _DEFAULT_OUTPUT_MAX_LINES
+        # Python-side copy of everything written to the Output tab (not subject
+        # to the line cap); route parsing and export read this instead of
+        # pulling the whole Text widget back through Tcl
+        self._output_chunks: List[str] = []
 
         # Theme colors (Dracula-like base + your palette)
         self.colors: Dict[str, str] = {
@@ -161,12 +519,25 @@ class TdGuiApp(tk.Tk):
         self._apply_theme()
 
         # Data
-        self.cmd_metas = load_commands()
+        self.cmd_metas = load_commands(os.path.join(self._config_dir(), 'td_gui_commands.pickle'))
+        self._sorted_cmds: List[str] = sorted(self.cmd_metas)
         self.current_meta: Optional[CommandMeta] = None
         self.widget_vars: Dict[OptionSpec, Dict[str, Any]] = {}
+        # Left-hand selector frames, built once per command and reused
+        self._selector_cache: Dict[str, ttk.Frame] = {}
+        # (spec, 'selected' var) for every option of the current command
+        self._spec_sel: List[Tuple[OptionSpec, Optional[tk.BooleanVar]]] = []
+        # Selector layout per command, keyed by (name, id(meta))
+        self._cat_cache: Dict[Tuple[str, int], List[Tuple[str, List[OptionSpec]]]] = {}
+        # Widget path -> scrollable area it belongs to (see _make_scrollable)
+        self._wheel_targets: Dict[str, Any] = {}
+        # Scroll area path -> whether its content currently overflows; dropped on
+        # resize or content change (see _invalidate_overflow)
+        self._overflow_cache: Dict[str, bool] = {}
+        self._reset_selected()
 
         # Paths
-        self.repo_dir = os.path.dirname(__file__)
+        self.repo_dir = os.path.dirname(os.path.abspath(__file__))
         self.trade_py = os.path.join(self.repo_dir, "trade.py")
 
         # Build UI
@@ -176,7 +547,10 @@ class TdGuiApp(tk.Tk):
         self._build_global_options()
 
         # Make all scrollable areas respond to mouse wheel
-        self._install_global_mousewheel()
+        self._install_mousewheel()
+
+        # Start pumping run output into the Output tab
+        self._drain_output_queue()
 
         # Load last-used paths (CWD/DB)
         self._load_prefs()
@@ -188,7 +562,7 @@ class TdGuiApp(tk.Tk):
             pass
 
         # Initialize with the first command
-        all_cmds = sorted(self.cmd_metas)
+        all_cmds = self._sorted_cmds
         if all_cmds:
             # Use restored command if available
             restore_cmd = getattr(self, "_restore_cmd", None)
@@ -202,9 +576,11 @@ class TdGuiApp(tk.Tk):
         # Now allow preference writes and save the fully restored state once
         self._suspend_save = False
         try:
-            self._save_prefs()
+            self._do_save_prefs()
         except Exception:
             pass
+        # Warm up a worker interpreter so the first Run starts immediately
+        asyncio.run_coroutine_threadsafe(self._spawn_warm_worker(), self._aio_loop)
 
     # ----- Top bar -----
     def _build_topbar(self):
@@ -217,7 +593,7 @@ class TdGuiApp(tk.Tk):
         self.cmd_combo = ttk.Combobox(
             top,
             textvariable=self.cmd_var,
-            values=sorted(self.cmd_metas),
+            values=self._sorted_cmds,
             state="readonly",
             width=20,
         )
@@ -270,15 +646,12 @@ class TdGuiApp(tk.Tk):
         self.selector_frame = ttk.Frame(self.selector_canvas)
         self.selector_frame.bind(
             "<Configure>",
-            lambda e: self.selector_canvas.configure(scrollregion=self.selector_canvas.bbox("all"))
+            lambda e: self._sched_scrollregion(self.selector_canvas)
         )
         self.selector_canvas.create_window((0,0), window=self.selector_frame, anchor="nw")
         self.selector_canvas.configure(yscrollcommand=self.selector_scroll.set)
         self.selector_canvas.grid(row=0, column=0, sticky="nsew")
         self.selector_scroll.grid(row=0, column=1, sticky="ns")
-        # Wheel on selector area
-        self._bind_mousewheel_target(self.selector_canvas)
-        self._bind_mousewheel_target(self.selector_frame, target=self.selector_canvas)
 
         # Right: editor (top) + notebook (bottom)
         right_container = ttk.Frame(self.main_pane)
@@ -300,21 +673,20 @@ class TdGuiApp(tk.Tk):
         self.sel_inner = ttk.Frame(self.sel_canvas)
         # Track help labels for dynamic wrap updates
         self._help_labels: List[ttk.Label] = []
+        # Wrap length last applied to all help labels
+        self._last_wrap_width = 0
         # Update scrollregion and help label wrap lengths on size changes
         self.sel_inner.bind("<Configure>", self._on_sel_inner_configure)
         self.sel_canvas.create_window((0,0), window=self.sel_inner, anchor="nw")
         self.sel_canvas.configure(yscrollcommand=self.sel_scroll.set)
         self.sel_canvas.grid(row=0, column=0, sticky="nsew")
         self.sel_scroll.grid(row=0, column=1, sticky="ns")
-        # Wheel on selected options area
-        self._bind_mousewheel_target(self.sel_canvas)
-        self._bind_mousewheel_target(self.sel_inner, target=self.sel_canvas)
 
         # Output/Help tabs
         self.tabs = ttk.Notebook(self.right_split)
         # Output tab
         out_tab = ttk.Frame(self.tabs)
-        # 0: status, 1: route cards (optional), 2: output
+        # 0: status, 1: route list (optional), 2: output
         out_tab.rowconfigure(0, weight=0)
         out_tab.rowconfigure(1, weight=0)
         out_tab.rowconfigure(2, weight=1)
@@ -323,16 +695,42 @@ class TdGuiApp(tk.Tk):
         self.run_status_var = tk.StringVar(value="")
         self.run_status = ttk.Label(out_tab, textvariable=self.run_status_var)
         self.run_status.grid(row=0, column=0, sticky="w", padx=4, pady=(2,2))
-        # Route cards container (populated when parsing 'run' output)
+        # Route list (populated when parsing 'run' output; hidden while empty).
+        # One Treeview row per route instead of a frame of widgets per route.
         self.routes_frame = ttk.Frame(out_tab)
         self.routes_frame.grid(row=1, column=0, sticky="ew", padx=4, pady=(2,4))
         self.routes_frame.columnconfigure(0, weight=1)
-        self._route_cards: List[Dict[str, Any]] = []
+        routes_bar = ttk.Frame(self.routes_frame)
+        routes_bar.grid(row=0, column=0, columnspan=2, sticky="ew", pady=(0,2))
+        routes_bar.columnconfigure(0, weight=1)
+        ttk.Label(routes_bar, text="Routes").grid(row=0, column=0, sticky="w")
+        ttk.Button(routes_bar, text="Copy Dest", command=self._copy_selected_dest, style="Secondary.TButton").grid(row=0, column=1, sticky="e", padx=(6,0))
+        ttk.Button(routes_bar, text="Swap to From", command=self._swap_selected_route).grid(row=0, column=2, sticky="e", padx=(6,0))
+        self.routes_tree = ttk.Treeview(
+            self.routes_frame,
+            columns=("title", "dest", "details"),
+            show="headings",
+            height=6,
+            selectmode="browse",
+            style="Routes.Treeview",
+        )
+        self.routes_tree.heading("title", text="Route", anchor="w")
+        self.routes_tree.heading("dest", text="Destination", anchor="w")
+        self.routes_tree.heading("details", text="Details", anchor="w")
+        self.routes_tree.column("title", width=320, stretch=False)
+        self.routes_tree.column("dest", width=200, stretch=False)
+        self.routes_tree.column("details", width=400, stretch=True)
+        routes_scroll = ttk.Scrollbar(self.routes_frame, orient="vertical", command=self.routes_tree.yview)
+        self.routes_tree.configure(yscrollcommand=routes_scroll.set)
+        self.routes_tree.grid(row=1, column=0, sticky="ew")
+        routes_scroll.grid(row=1, column=1, sticky="ns")
+        self.routes_frame.grid_remove()
+        # Parsed routes; index i is the Treeview row with iid str(i)
+        self._routes: List[Dict[str, str]] = []
         # Output area
         self.output = ScrolledText(out_tab, wrap="word")
         self.output.grid(row=2, column=0, sticky="nsew")
         self._style_scrolled_text(self.output)
-        self._bind_mousewheel_target(self.output)
         # Help tab
         help_tab = ttk.Frame(self.tabs)
         help_tab.rowconfigure(0, weight=1)
@@ -340,7 +738,6 @@ class TdGuiApp(tk.Tk):
         self.help_text = ScrolledText(help_tab, wrap="word", height=12)
         self.help_text.grid(row=0, column=0, sticky="nsew")
         self._style_scrolled_text(self.help_text)
-        self._bind_mousewheel_target(self.help_text)
         self.tabs.add(out_tab, text="Output")
         self.tabs.add(help_tab, text="Help")
         self.tabs.bind("<<NotebookTabChanged>>", self._on_tab_changed)
@@ -393,38 +790,72 @@ class TdGuiApp(tk.Tk):
         # Detail / Quiet / Debug counters on the right
         ttk.Label(bottom, text="Detail:").grid(row=0, column=6, sticky="e")
         self.detail_var = tk.IntVar(value=0)
-        ttk.Spinbox(bottom, from_=0, to=5, textvariable=self.detail_var, width=3, command=self._update_preview).grid(row=0, column=7, sticky="e", padx=(0,6))
+        ttk.Spinbox(bottom, from_=0, to=5, textvariable=self.detail_var, width=3, command=self._schedule_preview).grid(row=0, column=7, sticky="e", padx=(0,6))
         ttk.Label(bottom, text="Quiet:").grid(row=1, column=6, sticky="e")
         self.quiet_var = tk.IntVar(value=0)
-        ttk.Spinbox(bottom, from_=0, to=5, textvariable=self.quiet_var, width=3, command=self._update_preview).grid(row=1, column=7, sticky="e", padx=(0,6))
+        ttk.Spinbox(bottom, from_=0, to=5, textvariable=self.quiet_var, width=3, command=self._schedule_preview).grid(row=1, column=7, sticky="e", padx=(0,6))
         ttk.Label(bottom, text="Debug:").grid(row=2, column=6, sticky="e")
         self.debug_var = tk.IntVar(value=0)
-        ttk.Spinbox(bottom, from_=0, to=5, textvariable=self.debug_var, width=3, command=self._update_preview).grid(row=2, column=7, sticky="e", padx=(0,6))
+        ttk.Spinbox(bottom, from_=0, to=5, textvariable=self.debug_var, width=3, command=self._schedule_preview).grid(row=2, column=7, sticky="e", padx=(0,6))
         # Export button next to Debug
         ttk.Button(bottom, text="Export", command=self._export_output).grid(row=2, column=8, sticky="e", padx=(6,6))
 
-        # Trace to update preview when globals change
-        self.cwd_var.trace_add("write", lambda *_: self._update_preview())
-        self.db_var.trace_add("write", lambda *_: self._update_preview())
-        self.linkly_var.trace_add("write", lambda *_: self._update_preview())
-
-        # Also persist on change
-        self.cwd_var.trace_add("write", lambda *_: self._save_prefs())
-        self.db_var.trace_add("write", lambda *_: self._save_prefs())
-        self.linkly_var.trace_add("write", lambda *_: self._save_prefs())
-        self.detail_var.trace_add("write", lambda *_: self._save_prefs())
-        self.quiet_var.trace_add("write", lambda *_: self._save_prefs())
-        self.debug_var.trace_add("write", lambda *_: self._save_prefs())
+        # One trace per global: update preview and persist on change
+        for var in (self.cwd_var, self.db_var, self.linkly_var,
+                    self.detail_var, self.quiet_var, self.debug_var):
+            var.trace_add("write", self._on_value_edited)
 
     def _clear_option_frames(self):
-        # Clear selector and selected entries
-        for child in self.selector_frame.winfo_children():
-            child.destroy()
+        # Hide the cached selectors and clear selected entries
+        for frame in self._selector_cache.values():
+            frame.grid_remove()
         for child in self.sel_inner.winfo_children():
             child.destroy()
+        self._help_labels.clear()
+        self._reset_selected()
+
+    def _reset_selected(self):
+        # Selected rows as parallel lists; index i is row i of the right panel
+        self._sel_specs: List[OptionSpec] = []
+        self._sel_vars: List[Any] = []    # BooleanVar (flags) / ttk.Entry (values)
+        self._sel_is_flag: List[bool] = []
+        self._sel_positional: List[bool] = []
+        self._sel_names: List[str] = []
+        self._sel_widgets: List[List[tk.Widget]] = []  # label, input[, help]
+
+    def _sel_index(self, spec: OptionSpec) -> int:
+        try:
+            return self._sel_specs.index(spec)
+        except ValueError:
+            return -1
+
+    def _sel_var(self, spec: OptionSpec) -> Optional[Any]:
+        i = self._sel_index(spec)
+        return self._sel_vars[i] if i >= 0 else None
+
+    def _set_sel_value(self, spec: OptionSpec, value: Any):
+        # Value entries have no textvariable, so write them directly
+        var = self._sel_var(spec)
+        if var is None:
+            return
+        if isinstance(var, ttk.Entry):
+            var.delete(0, tk.END)
+            var.insert(0, str(value))
+            self._on_value_edited()
+        else:
+            var.set(value)
+
+    def _on_value_edited(self, *_):
+        self._invalidate_args()
+        self._schedule_save()
+
+    def _drop_selector_cache(self):
+        # Forget all cached selectors so they are rebuilt with default selections
+        for frame in self._selector_cache.values():
+            frame.destroy()
+        self._selector_cache.clear()
         self.widget_vars.clear()
-        # Also keep a selection map
-        self._selected: Dict[OptionSpec, Dict[str, Any]] = {}
+        self._spec_sel = []
 
     # ----- Populate dynamic forms -----
     def _on_command_change(self):
@@ -438,14 +869,45 @@ class TdGuiApp(tk.Tk):
         name = self.cmd_var.get()
         self.current_meta = self.cmd_metas.get(name)
         self._clear_option_frames()
+        self._spec_sel = []
         if not self.current_meta:
             return
 
-        # Build left selector groups and pre-select required args
+        frame = self._selector_cache.get(name)
+        cached = frame is not None
+        if not cached:
+            frame = self._build_selector_for(name)
+            self._selector_cache[name] = frame
+        # Flat (spec, 'selected' var) list for this command, in selector order;
+        # save/restore walk this instead of re-categorizing on every save
+        self._spec_sel = [
+            (spec, self.widget_vars.get(spec, {}).get("selected"))
+            for _, specs in self._categorize_current()
+            for spec in specs
+        ]
+        if cached:
+            # Reuse the cached selector; re-add rows for options still ticked
+            for spec, sel_var in self._spec_sel:
+                if sel_var is not None and sel_var.get():
+                    self._ensure_selected_row(spec)
+        frame.grid(row=0, column=0, sticky="ew")
+
+        # Apply saved values for this command, if any
+        self._apply_saved_state_for_current()
+        self._invalidate_args()
+        self._schedule_save()
+        # Track which command the UI currently represents
+        self._current_cmd_label = name
+
+    def _build_selector_for(self, name: str) -> ttk.Frame:
+        # Build left selector groups for the current command (`name`) and
+        # pre-select required args
+        frame = ttk.Frame(self.selector_frame)
+        frame.columnconfigure(0, weight=1)
         groups = self._categorize_current()
         row = 0
         for group_name, specs in groups:
-            lf = ttk.LabelFrame(self.selector_frame, text=group_name)
+            lf = ttk.LabelFrame(frame, text=group_name)
             lf.grid(row=row, column=0, sticky="ew", padx=4, pady=4)
             lf.columnconfigure(1, weight=1)
             r = 0
@@ -462,20 +924,15 @@ class TdGuiApp(tk.Tk):
                 self.widget_vars.setdefault(spec, {})["selected"] = var
                 # Bind
                 def make_cb(s=spec, v=var):
-                    return lambda *_: (self._on_toggle_option(s, v.get()), self._save_prefs())
+                    return lambda *_: (self._on_toggle_option(s, v.get()), self._schedule_save())
                 var.trace_add("write", make_cb())
                 # If pre-selected (required), add to editor panel
                 if var.get():
                     self._ensure_selected_row(spec)
                 r += 1
             row += 1
-
-        # Apply saved values for this command, if any
-        self._apply_saved_state_for_current()
-        self._update_preview()
-        self._save_prefs()
-        # Track which command the UI currently represents
-        self._current_cmd_label = name
+        self._make_scrollable(self.selector_canvas, frame, recursive=True)
+        return frame
 
     def _on_toggle_option(self, spec: OptionSpec, selected: bool):
         # enforce mutual exclusion if needed
@@ -494,12 +951,12 @@ class TdGuiApp(tk.Tk):
             self._ensure_selected_row(spec)
         else:
             self._remove_selected_row(spec)
-        self._update_preview()
+        self._invalidate_args()
 
     def _ensure_selected_row(self, spec: OptionSpec):
-        if spec in self._selected:
+        if spec in self._sel_specs:
             return
-        row = len(self._selected)
+        row = len(self._sel_specs)
         lbl = ttk.Label(self.sel_inner, text=spec.display_name + ":")
         lbl.grid(row=row*2, column=0, sticky="w", padx=6, pady=(6,0))
         # For flags, show a checked indicator but no input
@@ -507,12 +964,12 @@ class TdGuiApp(tk.Tk):
             val_var = tk.BooleanVar(value=True)
             chk = ttk.Checkbutton(self.sel_inner, variable=val_var)
             chk.grid(row=row*2, column=1, sticky="w", padx=6, pady=(6,0))
-            val_var.trace_add("write", lambda *_: (self._update_preview(), self._save_prefs()))
-            help_lbl = None
-            widgets = {"flag": val_var, "row": row}
+            val_var.trace_add("write", self._on_value_edited)
+            row_widgets = [lbl, chk]
         else:
-            val_var = tk.StringVar()
-            entry = ttk.Entry(self.sel_inner, textvariable=val_var)
+            # No textvariable: a single event binding replaces per-keystroke traces
+            entry = ttk.Entry(self.sel_inner)
+            val_var = entry
             entry.grid(row=row*2, column=1, sticky="ew", padx=6, pady=(6,0))
             try:
                 entry.configure(insertbackground=self.colors["fg"])
@@ -521,7 +978,8 @@ class TdGuiApp(tk.Tk):
             self.sel_inner.columnconfigure(1, weight=1)
             if spec.default not in (None, False):
                 entry.insert(0, str(spec.default))
-            val_var.trace_add("write", lambda *_: (self._update_preview(), self._save_prefs()))
+            for seq in ("<KeyRelease>", "<<Paste>>", "<<PasteSelection>>", "<<Cut>>"):
+                entry.bind(seq, self._on_value_edited, add="+")
             help_lbl = None
             if spec.help:
                 help_lbl = ttk.Label(
@@ -533,42 +991,48 @@ class TdGuiApp(tk.Tk):
                 )
                 help_lbl.grid(row=row*2+1, column=0, columnspan=2, sticky="ew", padx=6)
                 self._help_labels.append(help_lbl)
-            widgets = {"value": val_var, "row": row, "help": help_lbl}
-        self._selected[spec] = widgets
+            # Row widgets in grid order: label, input, then help (one row below)
+            row_widgets = [lbl, entry] + ([help_lbl] if help_lbl is not None else [])
+        self._sel_specs.append(spec)
+        self._sel_vars.append(val_var)
+        self._sel_is_flag.append(spec.is_flag)
+        self._sel_positional.append(spec.is_positional)
+        self._sel_names.append(spec.display_name)
+        self._sel_widgets.append(row_widgets)
+        self._make_scrollable(self.sel_canvas, *row_widgets)
+        self._args_dirty = True
 
     def _remove_selected_row(self, spec: OptionSpec):
-        widgets = self._selected.pop(spec, None)
-        if not widgets:
+        idx = self._sel_index(spec)
+        if idx < 0:
             return
-        # Destroy row widgets: find widgets in the row (labels/entries)
-        for w in list(self.sel_inner.grid_slaves()):
-            info = w.grid_info()
-            # Each row occupies two grid rows: row*2 and row*2+1
-            if info.get("row") in (widgets.get("row", -1)*2, widgets.get("row", -1)*2 + 1):
-                w.destroy()
-        # Re-pack remaining rows
-        for i, (s, wd) in enumerate(list(self._selected.items())):
-            # Move to new row index i
-            target_r0 = i*2
-            # Find row of label of s
-            for w in self.sel_inner.grid_slaves():
-                inf = w.grid_info()
-                if inf.get("row") == wd.get("row")*2:
-                    w.grid(row=target_r0, column=inf.get("column"))
-                elif inf.get("row") == wd.get("row")*2 + 1:
-                    w.grid(row=target_r0+1, column=inf.get("column"))
-            wd["row"] = i
+        row_widgets = self._sel_widgets[idx]
+        for lst in (self._sel_specs, self._sel_vars, self._sel_is_flag,
+                    self._sel_positional, self._sel_names, self._sel_widgets):
+            del lst[idx]
+        self._args_dirty = True
+        # Destroy this row's widgets directly
+        for w in row_widgets:
+            w.destroy()
+        # Shift the rows below up in a single pass; each row occupies two
+        # grid rows: row*2 (label/input) and row*2+1 (help)
+        for i in range(idx, len(self._sel_widgets)):
+            for j, w in enumerate(self._sel_widgets[i]):
+                w.grid_configure(row=i*2 + (1 if j == 2 else 0))
         # Also purge from help label tracker
-        try:
-            hl = widgets.get("help")
-            if hl in self._help_labels:
-                self._help_labels.remove(hl)
-        except Exception:
-            pass
-        self._save_prefs()
+        if len(row_widgets) > 2 and row_widgets[2] in self._help_labels:
+            self._help_labels.remove(row_widgets[2])
+        self._schedule_save()
 
     # ----- Build args and preview -----
+    def _invalidate_args(self):
+        # Mark the cached argument list stale and queue a preview rebuild
+        self._args_dirty = True
+        self._schedule_preview()
+
     def _build_args(self) -> List[str]:
+        if not self._args_dirty:
+            return self._cached_args
         if not self.current_meta:
             return []
         # If this meta defines fixed args, use them verbatim
@@ -578,65 +1042,102 @@ class TdGuiApp(tk.Tk):
             parts: List[str] = [self.current_meta.name]
 
         # Selected options (right panel)
-        for spec, wd in self._selected.items():
-            if spec.is_flag:
-                if wd.get("flag").get():
-                    parts.append(spec.display_name)
+        sel_vars = self._sel_vars
+        sel_is_flag = self._sel_is_flag
+        sel_positional = self._sel_positional
+        sel_names = self._sel_names
+        for i, spec in enumerate(self._sel_specs):
+            name = sel_names[i]
+            if sel_is_flag[i]:
+                if sel_vars[i].get():
+                    parts.append(name)
             else:
-                val = wd.get("value").get().strip()
+                val = sel_vars[i].get().strip()
                 if val != "":
                     # For positional required arguments, emit only the value
-                    if spec.is_positional:
+                    if sel_positional[i]:
                         parts.append(val)
                     # Support comma-separated values for append-type options
                     elif spec.multiple and "," in val:
                         for v in [x.strip() for x in val.split(',') if x.strip()]:
-                            parts.extend([spec.display_name, v])
+                            parts.extend([name, v])
                     else:
-                        parts.extend([spec.display_name, val])
+                        parts.extend([name, val])
 
         # Global/common switches
         # cwd (-C)
-        if self.cwd_var.get().strip():
-            parts.extend(["-C", self.cwd_var.get().strip()])
+        cwd = self.cwd_var.get().strip()
+        if cwd:
+            parts.extend(["-C", cwd])
         # db
-        if self.db_var.get().strip():
-            parts.extend(["--db", self.db_var.get().strip()])
+        db = self.db_var.get().strip()
+        if db:
+            parts.extend(["--db", db])
         # link-ly (-L)
-        if self.linkly_var.get().strip():
-            parts.extend(["-L", self.linkly_var.get().strip()])
+        linkly = self.linkly_var.get().strip()
+        if linkly:
+            parts.extend(["-L", linkly])
         # detail (-v), quiet (-q), debug (-w)
         parts.extend(["-v"] * int(self.detail_var.get()))
         parts.extend(["-q"] * int(self.quiet_var.get()))
         parts.extend(["-w"] * int(self.debug_var.get()))
 
+        self._cached_args = parts
+        self._args_dirty = False
         return parts
 
-    def _update_preview(self):
+    def _schedule_preview(self):
+        # Coalesce bursts of changes (e.g. typing) into a single preview rebuild
+        if self._preview_job:
+            self.after_cancel(self._preview_job)
+        self._preview_job = self.after(150, self._do_update_preview)
+
+    def _flush_preview(self):
+        # Apply a pending preview rebuild now (for actions that read the preview)
+        if self._preview_job:
+            self.after_cancel(self._preview_job)
+            self._do_update_preview()
+
+    def _do_update_preview(self):
+        self._preview_job = None
         args = self._build_args()
         # Render a shell-like preview
         cmd = [sys.executable, self.trade_py] + args
-        def quote_double(s: str) -> str:
-            s = str(s)
-            if s is None:
-                s = ""
-            # For preview: trim leading/trailing whitespace
-            s = s.strip()
-            needs_quotes = (s == "" or any(ch.isspace() for ch in s) or "/" in s)
-            if needs_quotes:
-                return '"' + s.replace('"', '\\"') + '"'
-            return s
-        self.preview_var.set(" ".join(quote_double(p) for p in cmd))
+        self.preview_var.set(" ".join(map(_quote_double, cmd)))
 
     # ----- Layout helpers -----
-    def _on_sel_inner_configure(self, event=None):
-        # Maintain scrollregion and re-wrap help labels to available width
+    def _sched_scrollregion(self, canvas: tk.Canvas):
+        # Geometry events arrive in bursts while resizing; only the last one in a
+        # burst updates the scrollregion
+        key = str(canvas)
+        job = self._scrollregion_jobs.get(key)
+        if job:
+            self.after_cancel(job)
+        self._scrollregion_jobs[key] = self.after_idle(self._apply_scrollregion, canvas)
+
+    def _apply_scrollregion(self, canvas: tk.Canvas):
+        key = str(canvas)
+        self._scrollregion_jobs.pop(key, None)
         try:
-            self.sel_canvas.configure(scrollregion=self.sel_canvas.bbox("all"))
+            bbox = canvas.bbox("all")
+            if bbox == self._scrollregion_last.get(key):
+                return
+            canvas.configure(scrollregion=bbox)
+            self._scrollregion_last[key] = bbox
+            self._invalidate_overflow(canvas)
         except Exception:
             pass
+
+    def _on_sel_inner_configure(self, event=None):
+        # Maintain scrollregion and re-wrap help labels to available width
+        self._sched_scrollregion(self.sel_canvas)
         try:
             wrap = max(300, self.sel_canvas.winfo_width() - 20)
+            # Re-wrapping every label is a Tcl call each; ignore small jitters
+            # (new labels pick up the current width when created)
+            if abs(wrap - self._last_wrap_width) < 10:
+                return
+            self._last_wrap_width = wrap
             for lbl in list(self._help_labels):
                 try:
                     lbl.configure(wraplength=wrap)
@@ -647,165 +1148,311 @@ class TdGuiApp(tk.Tk):
 
     # ----- Running the command -----
     def _run(self):
-        self.output.delete("1.0", tk.END)
+        self._reset_output()
         self._start_timer()
         self._clear_routes()
-        args = [sys.executable, self.trade_py] + self._build_args()
+        is_run = bool(self.current_meta) and self.current_meta.name == 'run'
+        self._route_parser = RouteStreamParser() if is_run else None
+        td_args = list(self._build_args())
 
-        def reader():
-            try:
-                proc = subprocess.Popen(
-                    args,
-                    cwd=self.repo_dir,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    universal_newlines=True,
-                    bufsize=1,
-                    env={**os.environ, "PYTHONIOENCODING": "UTF-8"},
-                )
-            except Exception as e:
-                self._append_output(f"Failed to start: {e}\n")
-                self.after(0, self._finish_timer)
-                return
+        asyncio.run_coroutine_threadsafe(self._run_async(td_args), self._aio_loop)
 
-            with proc.stdout:
-                for line in iter(proc.stdout.readline, ''):
-                    self._append_output(line)
-            rc = proc.wait()
-            self.after(0, self._finish_timer)
-            # Post-process output to extract routes (on main thread)
-            self.after(0, self._process_routes_from_output)
-            # Persist the latest output for this command so it restores on tab switch
-            self.after(0, self._save_prefs)
+    async def _spawn_warm_worker(self):
+        # Start an interpreter that imports tradedangerous ahead of time and then
+        # waits for the argv of the next run; each worker serves a single run
+        if self._aio_closing or self._warm_spawning or (self._warm_proc is not None and self._warm_proc.returncode is None):
+            return
+        self._warm_spawning = True
+        try:
+            self._warm_proc = await asyncio.create_subprocess_exec(
+                sys.executable, "-c", _WARM_WORKER_SRC, self.trade_py,
+                cwd=self.repo_dir,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                env={**os.environ, "PYTHONIOENCODING": "UTF-8"},
+            )
+        except Exception:
+            self._warm_proc = None
+        finally:
+            self._warm_spawning = False
+
+    async def _take_warm_worker(self, td_args: List[str]) -> Optional[asyncio.subprocess.Process]:
+        # Hand the run to the pre-started worker, if one is alive
+        import json
+        proc, self._warm_proc = self._warm_proc, None
+        if proc is None or proc.returncode is not None:
+            return None
+        try:
+            proc.stdin.write((json.dumps(td_args) + "\n").encode("utf-8"))
+            await proc.stdin.drain()
+            proc.stdin.close()
+        except Exception:
+            try:
+                proc.kill()
+            except Exception:
+                pass
+            return None
+        return proc
 
-        threading.Thread(target=reader, daemon=True).start()
+    async def _run_async(self, td_args: List[str]):
+        # Runs on the helper asyncio loop thread; output goes to the drain queue
+        try:
+            proc = await self._take_warm_worker(td_args)
+            if proc is None:
+                # No warm worker available: start trade.py cold
+                try:
+                    proc = await asyncio.create_subprocess_exec(
+                        sys.executable, self.trade_py, *td_args,
+                        cwd=self.repo_dir,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.STDOUT,
+                        env={**os.environ, "PYTHONIOENCODING": "UTF-8"},
+                    )
+                except Exception as e:
+                    self._append_output(f"Failed to start: {e}\n")
+                    return
+            self._run_proc = proc
+
+            # Read whatever the pipe holds (up to 64KB) at a time; the incremental
+            # decoder keeps multi-byte characters and \r\n pairs intact across
+            # block boundaries
+            decoder = io.IncrementalNewlineDecoder(
+                codecs.getincrementaldecoder("utf-8")("replace"), translate=True
+            )
+            while True:
+                buf = await proc.stdout.read(65536)
+                if not buf:
+                    break
+                text = decoder.decode(buf)
+                if text:
+                    self._append_output(text)
+            text = decoder.decode(b"", final=True)
+            if text:
+                self._append_output(text)
+            await proc.wait()
+        except Exception as e:
+            self._append_output(f"\nRun failed: {e}\n")
+        finally:
+            self._run_proc = None
+            # Tell the drain tick (on the Tk thread) that this run is over
+            self._out_q.put(_RUN_DONE)
+            # Have a worker ready for the next run
+            if not self._aio_closing:
+                self._aio_loop.create_task(self._spawn_warm_worker())
+
+    async def _shutdown_async(self):
+        # Runs on the asyncio loop when the window closes: kill the idle worker
+        # and any running command, and reap them while the loop is still alive
+        # (otherwise their transports are finalized after it's gone and print
+        # "Event loop is closed" tracebacks at exit)
+        self._aio_closing = True
+        while self._warm_spawning:
+            # A worker is being started; let it land so it gets reaped too
+            await asyncio.sleep(0.01)
+        for proc in (self._warm_proc, self._run_proc):
+            if proc is None or proc.returncode is not None:
+                continue
+            try:
+                proc.kill()
+            except Exception:
+                pass
+            try:
+                await proc.wait()
+            except Exception:
+                pass
 
     def _append_output(self, text: str):
-        def _append():
+        # Safe to call from any thread; the drain timer does the widget insert
+        self._out_q.put(text)
+
+    def _drain_output_queue(self):
+        # Batch everything queued since the last tick into a single insert
+        chunks: List[str] = []
+        finished = False
+        try:
+            while True:
+                item = self._out_q.get_nowait()
+                if item is _RUN_DONE:
+                    finished = True
+                    break
+                chunks.append(item)
+        except queue.Empty:
+            pass
+        try:
+            if chunks:
+                text = "".join(chunks)
+                # Only follow the output if the view was already at the bottom, so
+                # we don't yank the user back down while they read earlier output
+                follow = self.output.yview()[1] >= 0.99
+                self.output.insert(tk.END, text)
+                self._output_chunks.append(text)
+                self._trim_output()
+                self._invalidate_overflow(self.output)
+                if follow:
+                    self.output.see(tk.END)
+                if self._route_parser is not None:
+                    self._feed_routes(self._route_parser.feed(text))
+            if finished:
+                self._on_run_finished()
+        finally:
+            # Keep draining even if handling this batch failed
+            self.after(50, self._drain_output_queue)
+
+    def _trim_output(self):
+        # Keep the Text widget bounded; insert/layout cost grows with line count
+        cap = self._output_max_lines
+        if cap <= 0:
+            return
+        line_count = int(self.output.index("end-1c").split(".")[0])
+        if line_count > cap:
+            self.output.delete("1.0", f"{line_count - cap + 1}.0")
+
+    def _on_run_finished(self):
+        self._finish_timer()
+        # Flush the last route block; earlier ones were added as they arrived
+        if self._route_parser is not None:
+            self._feed_routes(self._route_parser.close())
+            self._route_parser = None
+        self._flush_routes()
+        # Persist the latest output for this command so it restores on tab switch
+        self._schedule_save()
+
+    def _reset_output(self, text: str = ""):
+        # Replace the Output tab contents and its mirror together
+        self.output.delete("1.0", tk.END)
+        self._output_chunks = [text] if text else []
+        if text:
             self.output.insert(tk.END, text)
-            self.output.see(tk.END)
-        self.after(0, _append)
+        self._invalidate_overflow(self.output)
+        # Mid-run (e.g. a command switch restoring saved output), restart route
+        # parsing from here so the old text's buffered partial block and queued
+        # rows don't land in the route list of the new text
+        if self._route_parser is not None:
+            self._route_parser = RouteStreamParser()
+            self._clear_routes()
+
+    def _output_text(self) -> str:
+        # Join the mirror once and keep the result, so repeated reads are cheap
+        chunks = self._output_chunks
+        if len(chunks) > 1:
+            self._output_chunks = chunks = ["".join(chunks)]
+        return chunks[0] if chunks else ""
 
     def _clear_output(self):
-        self.output.delete("1.0", tk.END)
+        self._reset_output()
     
     # ----- Routes parsing and UI -----
     def _clear_routes(self):
-        for child in list(self.routes_frame.winfo_children()):
-            try:
-                child.destroy()
-            except Exception:
-                pass
-        self._route_cards = []
+        try:
+            self.routes_tree.delete(*self.routes_tree.get_children())
+            self.routes_frame.grid_remove()
+        except Exception:
+            pass
+        self._routes = []
+        self._routes_shown_fp = None
+        self._pending_routes = []
+        if self._routes_refresh_job is not None:
+            self.after_cancel(self._routes_refresh_job)
+            self._routes_refresh_job = None
     
     def _strip_ansi(self, s: str) -> str:
-        import re
-        return re.sub(r"\x1b\[[0-9;]*m", "", s)
+        return _strip_ansi_text(s)
     
     def _parse_routes(self, text: str) -> List[Dict[str, str]]:
-        import re
-        # Normalize text
-        text = self._strip_ansi(text)
-        lines = text.splitlines()
-        routes: List[Dict[str, str]] = []
-        current: List[str] = []
-        start_pat = re.compile(r"^\s*(.+?)\s*->\s*(.+?)(?:\s*\(score:.*)?\s*$")
-        for ln in lines:
-            if start_pat.match(ln):
-                if current:
-                    block = "\n".join(current).strip()
-                    if block:
-                        # Extract destination from the first line of block
-                        m = start_pat.match(current[0])
-                        dest_line = m.group(2).strip() if m else ""
-                        routes.append({"block": block, "dest": dest_line})
-                    current = []
-            if ln.strip() == "":
-                # keep blank lines to preserve block text, but don't accumulate leading empties
-                if current:
-                    current.append(ln)
-                continue
-            current.append(ln)
-        if current:
-            block = "\n".join(current).strip()
-            if block:
-                m = start_pat.match(current[0])
-                dest_line = m.group(2).strip() if m else ""
-                routes.append({"block": block, "dest": dest_line})
-        return routes
+        # Only the most recent result is kept; unchanged text skips the parse
+        fp = (len(text), hash(text))
+        cached = self._routes_cache
+        if cached is not None and cached[0] == fp:
+            return list(cached[1])
+        routes = parse_route_blocks(text)
+        self._routes_cache = (fp, routes)
+        return list(routes)
     
+    def _feed_routes(self, routes: List[Dict[str, str]]):
+        # Bursty output adds routes to the list at most once per 150ms
+        if not routes:
+            return
+        self._pending_routes.extend(routes)
+        if self._routes_refresh_job is None:
+            self._routes_refresh_job = self.after(150, self._flush_routes)
+
+    def _flush_routes(self):
+        if self._routes_refresh_job is not None:
+            self.after_cancel(self._routes_refresh_job)
+            self._routes_refresh_job = None
+        routes, self._pending_routes = self._pending_routes, []
+        if not routes:
+            return
+        self._routes_shown_fp = None
+        try:
+            self._add_route_rows(routes)
+        except Exception:
+            # Don't let UI crash because of parsing issues
+            self._clear_routes()
+
     def _process_routes_from_output(self):
         try:
             if not self.current_meta or self.current_meta.name != 'run':
                 self._clear_routes()
                 return
-            text = self.output.get("1.0", tk.END)
+            text = self._output_text()
+            fp = (len(text), hash(text))
+            if fp == self._routes_shown_fp:
+                # Cards already reflect this exact output
+                return
             routes = self._parse_routes(text)
             if not routes:
                 self._clear_routes()
                 return
-            self._build_route_cards(routes)
+            self._build_route_rows(routes)
+            self._routes_shown_fp = fp
         except Exception:
             # Don't let UI crash because of parsing issues
             self._clear_routes()
             return
     
-    def _build_route_cards(self, routes: List[Dict[str, str]]):
+    def _build_route_rows(self, routes: List[Dict[str, str]]):
+        # Reuse what the list already shows: nothing to do if unchanged, and
+        # only the new tail is inserted when routes were appended
+        self._flush_routes()
+        shown = len(self._routes)
+        if shown and routes[:shown] == self._routes:
+            self._add_route_rows(routes[shown:])
+            return
         self._clear_routes()
-        # Style for route cards
+        self._add_route_rows(routes)
+
+    def _add_route_rows(self, routes: List[Dict[str, str]]):
+        # Append rows after any already shown (used while output streams in)
+        first_idx = len(self._routes)
+        tree = self.routes_tree
+        for idx, rt in enumerate(routes, first_idx):
+            tree.insert("", "end", iid=str(idx), values=(rt["title"], rt["dest"], rt["preview"]))
+            self._routes.append(rt)
+        # Show the list and default-select the first route
+        if first_idx == 0 and self._routes:
+            self.routes_frame.grid()
+            tree.selection_set("0")
+
+    def _selected_route_dest(self) -> Optional[str]:
+        sel = self.routes_tree.selection()
+        if not sel:
+            return None
         try:
-            style = ttk.Style(self)
-            style.configure("RouteCard.TFrame", background=self.colors["panel"], bordercolor=self.colors["line"], relief="groove")
-            style.configure("RouteCardSelected.TFrame", background=self.colors["surface"], bordercolor=self.colors["primary"], relief="solid")
-            style.configure("RouteTitle.TLabel", background=self.colors["panel"], foreground=self.colors["fg"])
-            style.configure("RouteBody.TLabel", background=self.colors["panel"], foreground=self.colors["muted"], wraplength=900, justify="left")
-        except Exception:
-            pass
-        # Build cards
-        for idx, rt in enumerate(routes):
-            card = ttk.Frame(self.routes_frame, style="RouteCard.TFrame")
-            card.grid(row=idx, column=0, sticky="ew", padx=2, pady=2)
-            card.columnconfigure(0, weight=1)
-            # Title (first line)
-            title = rt["block"].splitlines()[0]
-            lbl_title = ttk.Label(card, text=title, style="RouteTitle.TLabel")
-            lbl_title.grid(row=0, column=0, sticky="w", padx=8, pady=(6,2))
-            # Body (optional: show a short preview of next lines)
-            body_lines = rt["block"].splitlines()[1:6]
-            if body_lines:
-                lbl_body = ttk.Label(card, text="\n".join(body_lines), style="RouteBody.TLabel")
-                lbl_body.grid(row=1, column=0, sticky="ew", padx=8)
-            # Actions row
-            btn_row = ttk.Frame(card, style="RouteCard.TFrame")
-            btn_row.grid(row=2, column=0, sticky="ew", padx=8, pady=(4,8))
-            btn_row.columnconfigure(0, weight=1)
-            btn_row.columnconfigure(1, weight=0)
-            btn_row.columnconfigure(2, weight=0)
-            dest = rt.get("dest", "").strip()
-            btn_copy = ttk.Button(btn_row, text="Copy Dest", command=lambda d=dest: self._copy_text(d), style="Secondary.TButton")
-            btn_copy.grid(row=0, column=1, sticky="e", padx=(6,0))
-            btn_swap = ttk.Button(btn_row, text="Swap to From", command=lambda d=dest: self._swap_from_to_dest(d))
-            btn_swap.grid(row=0, column=2, sticky="e", padx=(6,0))
-            # Click to select highlight
-            def on_select(event=None, i=idx):
-                self._select_route_card(i)
-            for w in (card, lbl_title, btn_row):
-                try:
-                    w.bind("<Button-1>", on_select)
-                except Exception:
-                    pass
-            self._route_cards.append({"frame": card, "dest": dest, "title": title})
-        # Default select first
-        if self._route_cards:
-            self._select_route_card(0)
-    
-    def _select_route_card(self, index: int):
-        for i, rc in enumerate(self._route_cards):
-            try:
-                rc["frame"].configure(style="RouteCardSelected.TFrame" if i == index else "RouteCard.TFrame")
-            except Exception:
-                pass
-        self._selected_route_index = index
+            return self._routes[int(sel[0])]["dest"]
+        except (ValueError, IndexError):
+            return None
+
+    def _copy_selected_dest(self):
+        dest = self._selected_route_dest()
+        if dest is not None:
+            self._copy_text(dest)
+
+    def _swap_selected_route(self):
+        dest = self._selected_route_dest()
+        if dest is not None:
+            self._swap_from_to_dest(dest)
     
     def _copy_text(self, text: str):
         try:
@@ -836,22 +1483,21 @@ class TdGuiApp(tk.Tk):
         if sel_var is not None and not sel_var.get():
             sel_var.set(True)
             self._ensure_selected_row(spec)
-        row = self._selected.get(spec)
-        if row and row.get('value') is not None:
-            try:
-                row['value'].set(dest)
-            except Exception:
-                pass
-        self._update_preview()
-        self._save_prefs()
+        try:
+            self._set_sel_value(spec, dest)
+        except Exception:
+            pass
+        self._schedule_preview()
+        self._schedule_save()
 
     # ----- Export helpers -----
     def _default_export_filename(self) -> str:
         return time.strftime("TD_%Y%m%d_%H%M%S")
 
     def _export_output(self):
-        text = self.output.get("1.0", tk.END)
-        if not text.strip():
+        self._flush_preview()
+        # Blank check without joining or stripping a copy of the whole output
+        if not any(c and not c.isspace() for c in self._output_chunks):
             messagebox.showinfo("Export", "There is no output to export yet.")
             return
         # Ask for destination path and format via a standard Save dialog
@@ -874,22 +1520,29 @@ class TdGuiApp(tk.Tk):
         try:
             lower = path.lower()
             if lower.endswith(".pdf"):
-                self._export_pdf(self._strip_ansi(text), path)
+                self._export_pdf(self._strip_ansi(self._output_text()), path)
             elif lower.endswith(".csv"):
-                routes = self._parse_routes(text)
-                self._export_csv(routes, path)
+                self._export_csv(self._routes_for_export(), path)
             elif lower.endswith(".flat") or lower.endswith(".flat.txt"):
-                routes = self._parse_routes(text)
-                self._export_flat(routes, path)
+                self._export_flat(self._routes_for_export(), path)
             elif lower.endswith(".raw") or lower.endswith(".raw.txt"):
-                self._export_txt(text, path, pretty=False)
+                self._export_txt(self._output_text(), path, pretty=False)
             else:
                 # default to pretty text
-                self._export_txt(self._strip_ansi(text), path, pretty=True)
+                self._export_txt(self._strip_ansi(self._output_text()), path, pretty=True)
             messagebox.showinfo("Export", f"Exported to:\n{path}")
         except Exception as e:
             messagebox.showerror("Export Failed", str(e))
 
+    def _routes_for_export(self) -> List[Dict[str, str]]:
+        # After a 'run' finishes (or is restored) the route list already holds
+        # every route in the output; otherwise parse it (memoized)
+        if self.current_meta and self.current_meta.name == 'run' and self._route_parser is None:
+            self._flush_routes()
+            if self._routes:
+                return list(self._routes)
+        return self._parse_routes(self._output_text())
+
     def _export_txt(self, text: str, path: str, pretty: bool = True):
         header = []
         if pretty:
@@ -900,18 +1553,20 @@ class TdGuiApp(tk.Tk):
         with open(path, "w", encoding="utf-8") as f:
             if header:
                 f.write("\n".join(header) + "\n\n")
-            f.write(text.rstrip() + "\n")
+            # Write the body and its newline separately rather than concatenating
+            # another full copy of the output
+            f.write(text.rstrip())
+            f.write("\n")
 
+    # Routes from _parse_routes are ANSI-stripped and carry their title and
+    # preview, so the route exports below write those as-is, one route at a time
     def _export_flat(self, routes: List[Dict[str, str]], path: str):
-        lines: List[str] = []
-        lines.append(f"Trade Dangerous GUI Flat Export ({time.strftime('%Y-%m-%d %H:%M:%S')})")
-        lines.append(f"Command: {self.preview_var.get()}")
-        lines.append("-" * 80)
-        for i, r in enumerate(routes, 1):
-            title = self._strip_ansi(r.get("block", "").splitlines()[0])
-            lines.append(f"{i:02d}. {title}")
         with open(path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines) + "\n")
+            f.write(f"Trade Dangerous GUI Flat Export ({time.strftime('%Y-%m-%d %H:%M:%S')})\n")
+            f.write(f"Command: {self.preview_var.get()}\n")
+            f.write("-" * 80 + "\n")
+            for i, r in enumerate(routes, 1):
+                f.write(f"{i:02d}. {r['title']}\n")
 
     def _export_csv(self, routes: List[Dict[str, str]], path: str):
         import csv
@@ -919,29 +1574,20 @@ class TdGuiApp(tk.Tk):
             w = csv.writer(f)
             w.writerow(["index", "origin", "destination", "route_title", "detail_preview"]) 
             for i, r in enumerate(routes, 1):
-                title = self._strip_ansi(r.get("block", "").splitlines()[0])
+                title = r["title"]
                 parts = [p.strip() for p in title.split("->", 1)]
                 origin = parts[0] if parts else ""
                 dest = parts[1] if len(parts) > 1 else r.get("dest", "")
-                body_lines = r.get("block", "").splitlines()[1:6]
-                preview = " | ".join(self._strip_ansi(bl).strip() for bl in body_lines)
-                w.writerow([i, origin, dest, title, preview])
+                w.writerow([i, origin, dest, title, r["preview"]])
 
     def _export_pdf(self, text: str, path: str):
-        try:
-            from reportlab.lib.pagesizes import letter
-            from reportlab.pdfgen import canvas
-            from reportlab.lib.units import inch
-            from reportlab.pdfbase.pdfmetrics import stringWidth
-        except Exception:
-            raise RuntimeError("PDF export requires 'reportlab'. Install with: pip install reportlab")
+        letter, canvas, inch, stringWidth = _reportlab()
         page_size = letter
         c = canvas.Canvas(path, pagesize=page_size)
         width, height = page_size
         left = 0.75 * inch
         right = width - 0.75 * inch
         top = height - 0.75 * inch
-        y = top
         font_name = "Courier"
         font_size = 10
         line_h = 12
@@ -953,13 +1599,16 @@ class TdGuiApp(tk.Tk):
             f"Command: {self.preview_var.get()}",
             "-" * 80,
         ]
-        lines = header + text.splitlines()
-        def wrap_line(s: str) -> List[str]:
-            s = s.replace('\t', '    ')
-            maxw = right - left
+        lines = itertools.chain(header, text.splitlines())
+        # Courier is monospaced for printable ASCII, so whether such a line fits
+        # is a length check against one measured glyph, not a stringWidth call
+        # per candidate. Other characters (arrows, CJK, control bytes) measure
+        # wider and go through stringWidth as before
+        maxw = right - left
+        max_chars = int(maxw // stringWidth("M", font_name, font_size))
+        def wrap_measured(s: str) -> List[str]:
             if stringWidth(s, font_name, font_size) <= maxw:
                 return [s]
-            # word wrap
             out: List[str] = []
             cur = ""
             for word in s.split(" "):
@@ -973,14 +1622,51 @@ class TdGuiApp(tk.Tk):
             if cur:
                 out.append(cur)
             return out
+        def wrap_line(s: str) -> List[str]:
+            s = s.replace('\t', '    ')
+            if not (s.isascii() and s.isprintable()):
+                return wrap_measured(s)
+            if len(s) <= max_chars:
+                return [s]
+            # word wrap
+            out: List[str] = []
+            cur: List[str] = []
+            cur_len = 0
+            for word in s.split(" "):
+                trial_len = cur_len + (1 if cur_len else 0) + len(word)
+                if trial_len <= max_chars:
+                    if cur_len:
+                        cur.append(" ")
+                    cur.append(word)
+                    cur_len = trial_len
+                else:
+                    if cur_len:
+                        out.append("".join(cur))
+                    cur = [word]
+                    cur_len = len(word)
+            if cur_len:
+                out.append("".join(cur))
+            return out
+        # One text object per page instead of a drawString per line; page
+        # capacity matches breaking once the next line would cross the margin
+        per_page = max(1, int((top - 0.75 * inch) // line_h))
+        def new_page_text():
+            t = c.beginText(left, top)
+            t.setFont(font_name, font_size)
+            t.setLeading(line_h)
+            return t
+        textobj = new_page_text()
+        on_page = 0
         for raw in lines:
             for ln in wrap_line(raw):
-                if y - line_h < 0.75 * inch:
+                if on_page == per_page:
+                    c.drawText(textobj)
                     c.showPage()
-                    c.setFont(font_name, font_size)
-                    y = top
-                c.drawString(left, y, ln)
-                y -= line_h
+                    textobj = new_page_text()
+                    on_page = 0
+                textobj.textLine(ln)
+                on_page += 1
+        c.drawText(textobj)
         c.save()
 
     def _show_help(self):
@@ -1003,6 +1689,7 @@ class TdGuiApp(tk.Tk):
             def write():
                 self.help_text.delete("1.0", tk.END)
                 self.help_text.insert(tk.END, out)
+                self._invalidate_overflow(self.help_text)
                 self.tabs.select(1)
             self.after(0, write)
 
@@ -1061,6 +1748,7 @@ class TdGuiApp(tk.Tk):
         self.run_status_var.set(f"Finished ({self._format_elapsed(elapsed)})")
 
     def _copy_preview(self):
+        self._flush_preview()
         try:
             self.clipboard_clear()
             self.clipboard_append(self.preview_var.get())
@@ -1068,7 +1756,7 @@ class TdGuiApp(tk.Tk):
             pass
 
     # ----- Preferences (persist CWD/DB) -----
-    def _config_dir(self) -> str:
+    def _compute_config_dir(self) -> str:
         if sys.platform.startswith('win'):
             base = os.getenv('APPDATA') or os.path.expanduser('~')
             return os.path.join(base, 'TradeDangerous')
@@ -1079,8 +1767,11 @@ class TdGuiApp(tk.Tk):
             base = os.path.join(os.path.expanduser('~'), '.config')
             return os.path.join(base, 'TradeDangerous')
 
+    def _config_dir(self) -> str:
+        return self._cfg_dir
+
     def _prefs_path(self) -> str:
-        return os.path.join(self._config_dir(), 'td_gui_prefs.json')
+        return self._prefs_file
 
     def _load_prefs(self):
         try:
@@ -1097,6 +1788,7 @@ class TdGuiApp(tk.Tk):
                 detail = self._prefs.get('detail')
                 quiet = self._prefs.get('quiet')
                 debug = self._prefs.get('debug')
+                max_lines = self._prefs.get('output_max_lines')
                 self._restore_cmd = self._prefs.get('selected_command')
                 if isinstance(cwd, str):
                     self.cwd_var.set(cwd)
@@ -1110,62 +1802,143 @@ class TdGuiApp(tk.Tk):
                     self.quiet_var.set(quiet)
                 if isinstance(debug, int):
                     self.debug_var.set(debug)
+                if isinstance(max_lines, int) and max_lines >= 0:
+                    self._output_max_lines = max_lines
         except Exception:
             # Ignore preference loading errors silently
             self._prefs = {}
 
-    def _save_prefs(self):
+    def _schedule_save(self):
+        # Coalesce bursts of changes into a single preferences write
+        if self._save_job:
+            self.after_cancel(self._save_job)
+        self._save_job = self.after(150, self._do_save_prefs)
+
+    def _do_save_prefs(self):
+        self._save_job = None
         if getattr(self, '_suspend_save', False):
             return
         try:
-            d = self._config_dir()
-            os.makedirs(d, exist_ok=True)
-            import json
             # Start with previous prefs to preserve per-command states
             data = dict(getattr(self, '_prefs', {}) or {})
-            # Update globals
-            data.update({
-                'cwd': self.cwd_var.get().strip(),
-                'db': self.db_var.get().strip(),
-                'linkly': self.linkly_var.get().strip(),
-                'detail': int(self.detail_var.get()),
-                'quiet': int(self.quiet_var.get()),
-                'debug': int(self.debug_var.get()),
-                'selected_command': self.cmd_var.get(),
-            })
-            # Update current command option states
+            data.update(self._collect_globals())
             if self.current_meta:
-                cmd_label = self.cmd_var.get()
-                cmd_state = data.setdefault('commands', {}).setdefault(cmd_label, {})
-                options = cmd_state.setdefault('options', {})
-                for group_name, specs in self._categorize_current():
-                    for spec in specs:
-                        key = spec.key
-                        sel_var = self.widget_vars.get(spec, {}).get('selected')
-                        selected = bool(sel_var.get()) if sel_var is not None else False
-                        rec = options.setdefault(key, {})
-                        rec['selected'] = selected
-                        if spec.is_flag:
-                            wd = self._selected.get(spec)
-                            rec['flag'] = bool(wd.get('flag').get()) if wd and wd.get('flag') else False
-                        else:
-                            wd = self._selected.get(spec)
-                            rec['value'] = str(wd.get('value').get()) if wd and wd.get('value') else ''
-                # Save terminal output for the active command
-                try:
-                    cmd_state['output'] = self.output.get("1.0", tk.END)
-                except Exception:
-                    pass
+                self._collect_command_state(self.cmd_var.get(), data)
             self._prefs = data
-            with open(self._prefs_path(), 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            self._write_prefs(data)
         except Exception:
             # Ignore preference saving errors silently
             pass
 
+    def _collect_globals(self) -> Dict[str, Any]:
+        return {
+            'cwd': self.cwd_var.get().strip(),
+            'db': self.db_var.get().strip(),
+            'linkly': self.linkly_var.get().strip(),
+            'detail': int(self.detail_var.get()),
+            'quiet': int(self.quiet_var.get()),
+            'debug': int(self.debug_var.get()),
+            'output_max_lines': int(self._output_max_lines),
+            'selected_command': self.cmd_var.get(),
+        }
+
+    def _collect_command_state(self, label: str, data: Dict[str, Any]):
+        # Record the current command's option states and terminal output under
+        # `label`. The dicts on that path are copied rather than updated in
+        # place, so a snapshot already handed to the prefs writer never changes
+        # (everything else in it is immutable strings and numbers)
+        commands = data['commands'] = dict(data.get('commands') or {})
+        cmd_state = commands[label] = dict(commands.get(label) or {})
+        options = {k: dict(v) for k, v in (cmd_state.get('options') or {}).items()}
+        self._store_option_states(options)
+        cmd_state['options'] = options
+        cmd_state['output'] = self._output_snapshot()
+
+    def _output_snapshot(self) -> str:
+        # The Output tab's text as Text.get("1.0", END) returns it, taken from
+        # the mirror: the last `cap` lines plus Tk's trailing newline. The mirror
+        # isn't capped, so walk back from its end instead of scanning all of it
+        cap = self._output_max_lines
+        if cap <= 0:
+            return self._output_text() + "\n"
+        need = cap
+        parts: List[str] = []
+        for chunk in reversed(self._output_chunks):
+            pos = len(chunk)
+            while need:
+                pos = chunk.rfind("\n", 0, pos)
+                if pos < 0:
+                    break
+                need -= 1
+            if not need:
+                parts.append(chunk[pos + 1:])
+                break
+            parts.append(chunk)
+        parts.reverse()
+        return "".join(parts) + "\n"
+
+    def _write_prefs(self, data: Dict[str, Any]):
+        # Hand the snapshot to the writer thread, which serializes it, skips
+        # the write when nothing changed and writes the file
+        with self._prefs_lock:
+            self._pending_prefs = (self._prefs_path(), data)
+            if self._prefs_writer is not None:
+                # Running writer will pick up the newer snapshot
+                return
+            self._prefs_writer = threading.Thread(target=self._prefs_writer_loop, daemon=True)
+            self._prefs_writer.start()
+
+    def _prefs_writer_loop(self):
+        import json
+        while True:
+            with self._prefs_lock:
+                pending, self._pending_prefs = self._pending_prefs, None
+                if pending is None:
+                    self._prefs_writer = None
+                    return
+            path, data = pending
+            try:
+                blob = json.dumps(data, indent=2, sort_keys=True)
+                if blob == self._last_saved_blob:
+                    continue
+                # Write a temp file and swap it in so an interrupted save never truncates prefs
+                tmp = path + '.tmp'
+                with open(tmp, 'w', encoding='utf-8') as f:
+                    f.write(blob)
+                os.replace(tmp, path)
+                self._last_saved_blob = blob
+            except Exception:
+                # Let the next save retry even if its content is identical
+                self._last_saved_blob = None
+
+    def _wait_prefs_written(self, timeout: float = 5.0):
+        with self._prefs_lock:
+            writer = self._prefs_writer
+        if writer is not None:
+            writer.join(timeout)
+
     def _on_close(self):
+        # Drop pending jobs and flush the final state synchronously
+        for job in (self._preview_job, self._save_job):
+            if job:
+                try:
+                    self.after_cancel(job)
+                except Exception:
+                    pass
+        self._preview_job = None
+        self._save_job = None
         try:
-            self._save_prefs()
+            self._do_save_prefs()
+        except Exception:
+            pass
+        # The writer thread is a daemon; let it finish the final save
+        self._wait_prefs_written()
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown_async(), self._aio_loop).result(2.0)
+        except Exception:
+            pass
+        try:
+            self._aio_loop.call_soon_threadsafe(self._aio_loop.stop)
         except Exception:
             pass
         self.destroy()
@@ -1180,43 +1953,39 @@ class TdGuiApp(tk.Tk):
             state = cmds.get(self.cmd_var.get(), {})
             options = state.get('options', {})
             # Update selection states and row values
-            for group_name, specs in self._categorize_current():
-                for spec in specs:
-                    opt = options.get(spec.key)
-                    if not opt:
-                        continue
-                    is_required = spec in self.current_meta.arguments
-                    target_sel = True if is_required else bool(opt.get('selected', False))
-                    sel_var = self.widget_vars.get(spec, {}).get('selected')
-                    if sel_var is not None:
+            for spec, sel_var in self._spec_sel:
+                opt = options.get(spec.key)
+                if not opt:
+                    continue
+                is_required = spec in self.current_meta.arguments
+                target_sel = True if is_required else bool(opt.get('selected', False))
+                if sel_var is not None:
+                    try:
+                        sel_var.set(target_sel)
+                    except Exception:
+                        pass
+                if target_sel:
+                    self._ensure_selected_row(spec)
+                    if spec.is_flag:
                         try:
-                            sel_var.set(target_sel)
+                            self._set_sel_value(spec, bool(opt.get('flag', True)))
                         except Exception:
                             pass
-                    if target_sel:
-                        self._ensure_selected_row(spec)
-                        row = self._selected.get(spec)
-                        if spec.is_flag:
+                    else:
+                        if 'value' in opt:
                             try:
-                                row.get('flag').set(bool(opt.get('flag', True)))
+                                self._set_sel_value(spec, str(opt.get('value') or ''))
                             except Exception:
                                 pass
-                        else:
-                            if 'value' in opt and row and row.get('value') is not None:
-                                try:
-                                    row.get('value').set(str(opt.get('value') or ''))
-                                except Exception:
-                                    pass
             # Restore saved terminal output for this command, if available
             out = state.get('output')
             if isinstance(out, str):
                 try:
-                    self.output.delete("1.0", tk.END)
-                    self.output.insert(tk.END, out)
+                    self._reset_output(out)
                     self.output.see(tk.END)
                 except Exception:
                     pass
-                # Rebuild route cards if this is 'run'
+                # Rebuild the route list if this is 'run'
                 if self.current_meta.name == 'run':
                     try:
                         self._process_routes_from_output()
@@ -1225,6 +1994,17 @@ class TdGuiApp(tk.Tk):
         except Exception:
             pass
 
+    def _store_option_states(self, options: Dict[str, Any]):
+        # Record selection and value of every option of the current command
+        for spec, sel_var in self._spec_sel:
+            rec = options.setdefault(spec.key, {})
+            rec['selected'] = bool(sel_var.get()) if sel_var is not None else False
+            var = self._sel_var(spec)
+            if spec.is_flag:
+                rec['flag'] = bool(var.get()) if var is not None else False
+            else:
+                rec['value'] = str(var.get()) if var is not None else ''
+
     def _save_state_for_label(self, label: str):
         """Save the current on-screen command state under the given label without
         changing the selected command in preferences. Used when switching commands
@@ -1235,50 +2015,33 @@ class TdGuiApp(tk.Tk):
         if not label or not self.current_meta:
             return
         try:
-            import json
-            d = self._config_dir()
-            os.makedirs(d, exist_ok=True)
-            # Start from existing prefs
+            # Record in memory only; the save scheduled here coalesces with the
+            # one the command switch schedules, so a switch costs one disk write
             data = dict(getattr(self, '_prefs', {}) or {})
-            cmd_state = data.setdefault('commands', {}).setdefault(label, {})
-            options = cmd_state.setdefault('options', {})
-            for group_name, specs in self._categorize_current():
-                for spec in specs:
-                    key = spec.key
-                    sel_var = self.widget_vars.get(spec, {}).get('selected')
-                    selected = bool(sel_var.get()) if sel_var is not None else False
-                    rec = options.setdefault(key, {})
-                    rec['selected'] = selected
-                    if spec.is_flag:
-                        wd = self._selected.get(spec)
-                        rec['flag'] = bool(wd.get('flag').get()) if wd and wd.get('flag') else False
-                    else:
-                        wd = self._selected.get(spec)
-                        rec['value'] = str(wd.get('value').get()) if wd and wd.get('value') else ''
-            # Save terminal output for this command
-            try:
-                cmd_state['output'] = self.output.get("1.0", tk.END)
-            except Exception:
-                pass
-            # Keep globals and selected_command untouched here; _save_prefs will handle them
+            self._collect_command_state(label, data)
             self._prefs = data
-            with open(self._prefs_path(), 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            self._schedule_save()
         except Exception:
             pass
 
     def _reset_defaults(self):
         """Reset all settings to initial defaults and clear saved preferences."""
         try:
-            # Remove prefs on disk
+            # Remove prefs on disk (after any in-flight write lands)
+            self._wait_prefs_written()
             p = self._prefs_path()
             if os.path.isfile(p):
                 try:
                     os.remove(p)
                 except Exception:
                     pass
+            self._last_saved_blob = None
             self._prefs = {}
             self._restore_cmd = None
+            # Rebuild selectors from scratch and don't carry the old command's
+            # state into the fresh preferences
+            self._current_cmd_label = None
+            self._drop_selector_cache()
             # Reset globals
             self.cwd_var.set("")
             self.db_var.set("")
@@ -1286,51 +2049,56 @@ class TdGuiApp(tk.Tk):
             self.detail_var.set(0)
             self.quiet_var.set(0)
             self.debug_var.set(0)
+            self._output_max_lines = _DEFAULT_OUTPUT_MAX_LINES
             # Reset to initial command ordering
-            all_cmds = sorted(self.cmd_metas)
+            all_cmds = self._sorted_cmds
             if all_cmds:
                 self.cmd_var.set(all_cmds[0])
                 self._on_command_change()
-            self._update_preview()
-            self._save_prefs()
+            self._schedule_preview()
+            self._schedule_save()
         except Exception:
             pass
 
     # ----- Mouse wheel helpers -----
-    def _install_global_mousewheel(self):
-        # Fallback: route wheel events to nearest scrollable ancestor anywhere in the app
-        self.bind_all("<MouseWheel>", self._on_global_mousewheel, add=True)
-        self.bind_all("<Button-4>", self._on_global_mousewheel, add=True)  # X11 up
-        self.bind_all("<Button-5>", self._on_global_mousewheel, add=True)  # X11 down
-
-    def _bind_mousewheel_target(self, widget, target=None):
-        # Bind wheel directly to a scrollable widget or route to a target (e.g., inner frame -> canvas)
-        tgt = target or widget
-
-        def _on_local_wheel(ev):
-            return self._scroll_target(tgt, ev)
-
-        widget.bind("<MouseWheel>", _on_local_wheel, add=True)
-        widget.bind("<Button-4>", _on_local_wheel, add=True)
-        widget.bind("<Button-5>", _on_local_wheel, add=True)
-
-    def _on_global_mousewheel(self, ev):
-        # Try to find a scrollable ancestor under the cursor and scroll it
-        w = ev.widget
-        # Walk up to find a widget that supports yview_scroll (Canvas/Text/Listbox/Treeview)
-        visited = 0
-        while w is not None and visited < 10:
-            if hasattr(w, 'yview_scroll'):
-                return self._scroll_target(w, ev)
-            try:
-                parent_path = w.winfo_parent()
-                if not parent_path:
-                    break
-                w = w._nametowidget(parent_path)
-            except Exception:
-                break
-            visited += 1
-        return None
+    def _install_mousewheel(self):
+        # Wheel events are bound once on the "Scrollable" bindtag; each widget
+        # inside a scrollable area carries the tag and maps straight to its area
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):  # Button-4/5: X11
+            self.bind_class(_SCROLL_TAG, seq, self._on_scrollable_wheel)
+        self.bind_class(_SCROLL_TAG, "<Destroy>", self._on_scrollable_destroy)
+        self._make_scrollable(self.selector_canvas, self.selector_canvas, self.selector_frame)
+        self._make_scrollable(self.sel_canvas, self.sel_canvas, self.sel_inner)
+        self._make_scrollable(self.output, self.output)
+        self._make_scrollable(self.help_text, self.help_text)
+        # Resizing (and typing into the text areas) can change whether content fits
+        for area in (self.selector_canvas, self.sel_canvas, self.output, self.help_text):
+            area.bind("<Configure>", lambda e, a=area: self._invalidate_overflow(a), add="+")
+        for area in (self.output, self.help_text):
+            area.bind("<KeyRelease>", lambda e, a=area: self._invalidate_overflow(a), add="+")
+
+    def _invalidate_overflow(self, area):
+        self._overflow_cache.pop(str(area), None)
+
+    def _make_scrollable(self, target, *widgets, recursive: bool = False):
+        # Route wheel events over `widgets` (and optionally their descendants,
+        # for prebuilt content) to `target`
+        for w in widgets:
+            self._wheel_targets[str(w)] = target
+            tags = w.bindtags()
+            if _SCROLL_TAG not in tags:
+                w.bindtags((_SCROLL_TAG,) + tags)
+            if recursive:
+                self._make_scrollable(target, *w.winfo_children(), recursive=True)
+
+    def _on_scrollable_wheel(self, ev):
+        target = self._wheel_targets.get(str(ev.widget))
+        if target is None:
+            return None
+        return self._scroll_target(target, ev)
+
+    def _on_scrollable_destroy(self, ev):
+        self._wheel_targets.pop(str(ev.widget), None)
 
     def _scroll_target(self, target, ev):
         # Compute scroll direction
@@ -1346,16 +2114,21 @@ class TdGuiApp(tk.Tk):
                 d = 0
             if d != 0:
                 delta = -1 if d > 0 else 1
-        # Only scroll if there is overflow (content doesn't fully fit)
-        try:
-            if hasattr(target, 'yview'):
+        # Only scroll if there is overflow (content doesn't fully fit); the
+        # answer is cached per area so most wheel events skip the yview query
+        key = str(target)
+        overflow = self._overflow_cache.get(key)
+        if overflow is None:
+            try:
                 first, last = target.yview()
                 # If the fraction span covers the whole content, don't intercept
-                if (last - first) >= 0.999:
-                    return None
-        except Exception:
-            # If we can't determine, fall through to try scrolling
-            pass
+                overflow = (last - first) < 0.999
+                self._overflow_cache[key] = overflow
+            except Exception:
+                # If we can't determine, fall through to try scrolling
+                overflow = True
+        if not overflow:
+            return None
 
         if delta != 0:
             try:
@@ -1383,98 +2156,18 @@ class TdGuiApp(tk.Tk):
         except Exception:
             pass
 
-        # Global style tweaks
-        style.configure(
-            ".",
-            foreground=c["fg"],
-            background=c["bg"],
-            fieldbackground=c["surface"],
-            bordercolor=c["line"],
-            lightcolor=c["bg"],
-            darkcolor=c["bg"],
-            focuscolor=c["primary"],
-        )
-
-        # Containers / text
-        style.configure("TFrame", background=c["bg"])
-        style.configure("TLabelframe", background=c["bg"], foreground=c["fg"], bordercolor=c["line"], relief="groove")
-        style.configure("TLabelframe.Label", background=c["bg"], foreground=c["fg"])
-        style.configure("TLabel", background=c["bg"], foreground=c["fg"])
-
-        # Inputs
-        style.configure("TEntry", fieldbackground=c["surface"], foreground=c["fg"], bordercolor=c["line"]) 
-        try:
-            style.configure("TEntry", insertcolor=c["fg"])
-        except Exception:
-            pass
-        style.map("TEntry",
-                  fieldbackground=[('focus', c["surface"])],
-                  bordercolor=[('focus', c["primary"])])
-
-        style.configure("TCombobox", fieldbackground=c["surface"], foreground=c["fg"], bordercolor=c["line"], arrowsize=12)
-        try:
-            style.configure("TCombobox", insertcolor=c["fg"])
-        except Exception:
-            pass
-        style.map("TCombobox",
-                  fieldbackground=[('readonly', c["surface"])],
-                  bordercolor=[('focus', c["primary"])],
-                  foreground=[('disabled', c["muted"])])
-
-        style.configure("TSpinbox", fieldbackground=c["surface"], foreground=c["fg"], bordercolor=c["line"]) 
-        style.map("TSpinbox", bordercolor=[('focus', c["primary"])])
-
-        # Buttons
-        style.configure("TButton", background=c["panel"], foreground=c["fg"], bordercolor=c["line"], focusthickness=2, focuscolor=c["primary"]) 
-        style.map("TButton",
-                  background=[('active', c["line"])],
-                  bordercolor=[('focus', c["primary"])])
-
-        style.configure("Accent.TButton", background=c["primary"], foreground=c["fg"], bordercolor=c["primary"], relief="flat")
-        style.map("Accent.TButton", background=[('active', c["primaryActive"])])
-
-        style.configure("Secondary.TButton", background=c["secondary"], foreground=c["fg"], bordercolor=c["secondary"], relief="flat")
-        style.map("Secondary.TButton", background=[('active', c["secondaryActive"])])
-
-        # Notebook
-        style.configure("TNotebook", background=c["bg"], borderwidth=0, tabmargins=(6, 4, 6, 0))
-        style.configure("TNotebook.Tab", background=c["panel"], foreground=c["fg"], padding=(12, 6), bordercolor=c["line"])
-        style.map("TNotebook.Tab",
-                  background=[('selected', c["surface"]), ('active', c["panel"])],
-                  foreground=[('selected', c["fg"])])
-
-        # Route card styles
+        # All style and option database settings go to Tcl as one script
+        # (built once per palette) instead of a call per setting
+        self._theme_sig = tuple(sorted(c.items()))
         try:
-            style.configure("RouteCard.TFrame", background=c["panel"], bordercolor=c["line"], relief="groove")
-            style.configure("RouteCardSelected.TFrame", background=c["surface"], bordercolor=c["primary"], relief="solid")
-            style.configure("RouteTitle.TLabel", background=c["panel"], foreground=c["fg"]) 
-            style.configure("RouteBody.TLabel", background=c["panel"], foreground=c["muted"]) 
-        except Exception:
+            self.tk.eval(_theme_script(self._theme_sig))
+        except tk.TclError:
             pass
 
-        # Paned window / scrollbars
-        style.configure("TPanedwindow", background=c["bg"], sashrelief="flat")
-        style.configure("Vertical.TScrollbar", background=c["panel"], troughcolor=c["bg"], arrowcolor=c["fg"])
-        style.configure("Horizontal.TScrollbar", background=c["panel"], troughcolor=c["bg"], arrowcolor=c["fg"])
-
-        # Tk widgets option db (Text/Listbox/Scrollbar popups)
-        self.option_add('*Text.background', c["surface"]) 
-        self.option_add('*Text.foreground', c["fg"]) 
-        self.option_add('*Text.insertBackground', c["fg"]) 
-        # Entry insertion cursor color (for classic Tk widgets and some ttk themes)
-        self.option_add('*Entry.insertBackground', c["fg"]) 
-        self.option_add('*Text.selectBackground', c["line"]) 
-        self.option_add('*Text.selectForeground', c["fg"]) 
-        self.option_add('*Listbox.background', c["surface"]) 
-        self.option_add('*Listbox.foreground', c["fg"]) 
-        self.option_add('*Listbox.selectBackground', c["line"]) 
-        self.option_add('*Listbox.selectForeground', c["fg"]) 
-        self.option_add('*Scrollbar.background', c["panel"]) 
-        self.option_add('*Scrollbar.activeBackground', c["panel"]) 
-        self.option_add('*Scrollbar.troughColor', c["bg"]) 
-        self.option_add('*Scrollbar.arrowColor', c["fg"]) 
-
     def _style_scrolled_text(self, widget: ScrolledText):
+        # Already styled for this palette: skip the reconfigure (and redisplay)
+        if getattr(widget, "_td_theme_sig", None) == self._theme_sig:
+            return
         c = self.colors
         try:
             widget.configure(
@@ -1487,69 +2180,78 @@ class TdGuiApp(tk.Tk):
                 borderwidth=0,
                 relief="flat",
             )
+            widget._td_theme_sig = self._theme_sig
         except Exception:
             pass
 
     def _browse_cwd(self):
-        from tkinter import filedialog
         d = filedialog.askdirectory(initialdir=self.cwd_var.get() or os.getcwd())
         if d:
             self.cwd_var.set(d)
 
     def _browse_db(self):
-        from tkinter import filedialog
         f = filedialog.askopenfilename(initialdir=os.path.expanduser("~"), filetypes=[("DB", "*.db"), ("All", "*.*")])
         if f:
             self.db_var.set(f)
 
     # ----- Categorization -----
-    def _categorize_current(self) -> List[Tuple[str, List[OptionSpec]]]:
+    def _categorize_current(self) -> Sequence[Tuple[str, List[OptionSpec]]]:
         if not self.current_meta:
-            return []
-        # Fallback: simple Required/Other
-        required = list(self.current_meta.arguments)
-        other = list(self.current_meta.switches)
-
+            return _NO_GROUPS
+        # Command metadata doesn't change while the app runs, so the layout is
+        # computed once per command ('Update/Rebuild DB' shares the name
+        # 'import', hence the id)
+        key = (self.current_meta.name, id(self.current_meta))
+        groups = self._cat_cache.get(key)
+        if groups is None:
+            groups = self._cat_cache[key] = self._categorize(self.current_meta)
+        return groups
+
+    def _categorize(self, meta: CommandMeta) -> List[Tuple[str, List[OptionSpec]]]:
         # Special layout for 'run'
-        if self.current_meta.name == 'run':
+        if meta.name == 'run':
             by_dest = {}
-            for s in required + other:
-                key1 = s.dest or s.long_flag.lstrip('-')
+            for s in itertools.chain(meta.arguments, meta.switches):
                 key2 = s.long_flag.lstrip('-')
+                key1 = s.dest or key2
                 by_dest[key1] = s
-                by_dest.setdefault(key2, s)
-            sects: List[Tuple[str, List[str]]] = [
-                ("Required", ["capacity", "credits"]),
-                ("Other", ["starting", "ending", "via", "limit", "blackMarket", "unique", "pruneScores", "shorten", "routes", "maxRoutes", "pruneHops"]),
-                ("Travel", ["goalSystem", "loop", "direct", "hops", "maxJumpsPer", "maxLyPer", "emptyLyPer", "startJumps", "endJumps", "showJumps", "supply", "demand"]),
-                ("Filters", ["avoid", "maxAge", "lsPenalty", "demand", "supply"]),
-                ("Constraints", ["padSize", "noPlanet", "planetary", "fleet", "odyssey", "maxLs"]),
-                ("Economy", ["minGainPerTon", "maxGainPerTon", "margin", "insurance"]),
-                ("Display", ["checklist", "x52pro", "progress", "summary"]),
+                if key1 != key2:
+                    by_dest.setdefault(key2, s)
+            # A spec can be reached under both its dest and its flag; it goes
+            # to the earliest (section, position) of either
+            placed: Dict[int, Tuple[Tuple[int, int], OptionSpec]] = {}
+            for key, s in by_dest.items():
+                pos = _RUN_NAME_POS.get(key)
+                if pos is None:
+                    continue
+                cur = placed.get(id(s))
+                if cur is None or pos < cur[0]:
+                    placed[id(s)] = (pos, s)
+            buckets: List[List[OptionSpec]] = [[] for _ in _RUN_SECTION_TITLES]
+            for (sec, _), s in sorted(placed.values(), key=lambda e: e[0]):
+                buckets[sec].append(s)
+            result: List[Tuple[str, List[OptionSpec]]] = [
+                (title, specs) for title, specs in zip(_RUN_SECTION_TITLES, buckets) if specs
             ]
-            used = set()
-            result: List[Tuple[str, List[OptionSpec]]] = []
-            for title, names in sects:
-                specs: List[OptionSpec] = []
-                for n in names:
-                    s = by_dest.get(n)
-                    if s and s not in used:
-                        specs.append(s)
-                        used.add(s)
-                if specs:
-                    result.append((title, specs))
-            # Any remaining not categorized
-            remaining = [s for s in (required + other) if s not in used]
+            # Any remaining not categorized, in declaration order
+            remaining = [s for s in itertools.chain(meta.arguments, meta.switches) if id(s) not in placed]
             if remaining:
                 result.append(("Misc", remaining))
             return result
 
-        # Generic fallback
-        return [("Required", required), ("Other", other)]
+        # Generic fallback: simple Required/Other (copied so the cached layout
+        # never aliases the command metadata)
+        return [("Required", list(meta.arguments)), ("Other", list(meta.switches))]
 
 
 def main():
+    # Fewer collections while handling UI events; widget wrappers, option specs
+    # and theme data built at startup live for the whole session
+    gc.set_threshold(50_000, 10, 10)
     app = TdGuiApp()
+    # Move everything built so far out of future collections' scans
+    gc.collect()
+    gc.freeze()
     app.mainloop()
 
 